@@ -0,0 +1,36 @@
+"""Headless analytics for the Ecommerce Toys Dashboard.
+
+Every compute function takes a ``Filters`` selection and returns a small
+result frame (or a dict of KPIs). Results are memoised per function, so the
+Streamlit app, batch reports and other consumers can share them.
+"""
+
+from .alerts import METRICS, AlertMonitor, daily_series, refresh_alerts
+from .cache import clear_caches
+from .data import ENCODED_COLUMNS, Tables, dictionaries, filter_options, load_data, set_tables, site_totals
+from .filters import (
+    ALL,
+    Filters,
+    filtered_orders,
+    filtered_sessions,
+    order_lines,
+    selected_sessions,
+)
+from .marketing import conversion_by_month, marketing_kpis, sessions_by_source
+from .paths import (
+    page_transitions,
+    session_durations,
+    session_length_distribution,
+    time_on_site_kpis,
+)
+from .prefetch import Prefetcher, adjacent_filters
+from .products import conversion_by_product, product_kpis, revenue_over_time_by_product
+from .queries import TAB_QUERIES
+from .sales import (
+    revenue_by_campaign,
+    revenue_by_product,
+    revenue_by_source,
+    revenue_by_year,
+    sales_kpis,
+)
+from .website import bounce_by_month, funnel, sessions_by_device, website_kpis
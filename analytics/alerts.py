@@ -0,0 +1,240 @@
+import math
+import threading
+
+import pandas as pd
+
+from .cache import register
+from .data import load_data
+
+# ---------------------------------------------------------
+# DAILY ANOMALY ALERTS
+# ---------------------------------------------------------
+# Daily revenue, sessions, conversion rate and refunds issued per item sold
+# are scored against an exponentially weighted mean/variance kept separately
+# for each weekday (weekly seasonality). A day outside mean ± THRESHOLD·std
+# is an alert.
+#
+# The monitor remembers how many rows of each table it has consumed, so a
+# refresh only aggregates appended rows and scores newly completed days:
+# O(new rows + new days), never the full history again. Tables are assumed
+# to be append-only; if one shrinks, the monitor starts over. Result frames
+# are built once per newly scored batch and shared until the next one.
+# Swapping in other tables (set_tables) resets the shared monitor.
+#
+# Refunds are counted on the day they are issued, not on the sale day of the
+# refunded item: they arrive days after the sale, so attributing them to
+# sale days would undercount every recently scored day. The metric is
+# therefore "refunds issued per item sold that day", not the Product tab's
+# refund rate.
+
+METRICS = {
+    "revenue": "Daily Revenue",
+    "sessions": "Daily Sessions",
+    "conversion_rate": "Daily Conversion Rate",
+    "refunds_per_item_sold": "Daily Refunds Issued per Item Sold",
+}
+
+ALPHA = 0.1       # EWMA weight of the newest same-weekday observation
+THRESHOLD = 3.0   # band half-width in standard deviations
+WARMUP = 4        # same-weekday observations before a metric is scored
+
+# Tables with activity every day: a day is complete once all of them have
+# rows past it. Refunds are too sparse to hold scoring back.
+_DAILY_TABLES = ("orders", "website_sessions")
+
+# Columns of the scored series, typed so that an empty series behaves like a full one
+_SERIES_DTYPES = {
+    "date": "datetime64[ns]",
+    "metric": str,
+    "value": "float64",
+    "expected": "float64",
+    "lower": "float64",
+    "upper": "float64",
+    "is_alert": "bool",
+}
+
+# Per-day running totals kept by the monitor
+_TOTALS = ("revenue", "orders", "sessions", "items", "refunded_items")
+
+# (table, column summed per day or None to count rows, total it feeds)
+_SOURCES = (
+    ("orders", "price_usd", "revenue"),
+    ("orders", None, "orders"),
+    ("website_sessions", None, "sessions"),
+    ("order_items", None, "items"),
+    ("refunds", None, "refunded_items"),
+)
+
+
+class _Band:
+    """Exponentially weighted mean and variance of one metric on one weekday."""
+
+    __slots__ = ("mean", "var", "count")
+
+    def __init__(self):
+        self.mean = 0.0
+        self.var = 0.0
+        self.count = 0
+
+    def bounds(self):
+        if self.count < WARMUP:
+            return None
+        spread = THRESHOLD * math.sqrt(self.var)
+        return self.mean - spread, self.mean + spread
+
+    def update(self, value):
+        if self.count == 0:
+            self.mean = value
+        else:
+            diff = value - self.mean
+            increment = ALPHA * diff
+            self.mean += increment
+            self.var = (1 - ALPHA) * (self.var + diff * increment)
+        self.count += 1
+
+
+class AlertMonitor:
+    """Incrementally maintained daily series and their anomaly flags."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._consumed = {}
+        self._daily = {}
+        self._bands = {}
+        self._first_day = None
+        self._latest_by_table = {}
+        self._scored_until = None
+        self._rows = []
+        self._frames = {}
+
+    def cache_clear(self):
+        """Forget everything consumed so far; the next refresh starts over."""
+        with self._lock:
+            self._reset()
+
+    # ------------------ Ingest ------------------
+    def refresh(self, tables=None):
+        """Consume rows appended to ``tables`` (default: the loaded data) since the last refresh."""
+        tables = tables if tables is not None else load_data()
+
+        with self._lock:
+            if any(len(getattr(tables, name)) < seen for name, seen in self._consumed.items()):
+                self._reset()
+
+            for name in {source[0] for source in _SOURCES}:
+                frame = getattr(tables, name)
+                new_rows = frame.iloc[self._consumed.get(name, 0):]
+                self._consumed[name] = len(frame)
+                if not new_rows.empty:
+                    self._ingest(name, new_rows)
+
+            self._score_completed_days()
+
+    def _ingest(self, name, new_rows):
+        days = pd.to_datetime(new_rows["created_at"]).dt.normalize()
+
+        for table, column, total in _SOURCES:
+            if table != name:
+                continue
+            grouped = new_rows[column].groupby(days).sum() if column else days.value_counts()
+            for day, amount in grouped.items():
+                self._daily.setdefault(day, dict.fromkeys(_TOTALS, 0))[total] += amount
+
+        if self._first_day is None or days.min() < self._first_day:
+            self._first_day = days.min()
+        if name not in self._latest_by_table or days.max() > self._latest_by_table[name]:
+            self._latest_by_table[name] = days.max()
+
+    def _score_completed_days(self):
+        # The latest day may still be receiving rows: score up to the day before.
+        # Late rows for an already scored day update its totals but not its flag.
+        if any(name not in self._latest_by_table for name in _DAILY_TABLES):
+            return
+
+        complete_until = min(self._latest_by_table[name] for name in _DAILY_TABLES)
+        scored_rows = len(self._rows)
+        start = self._scored_until if self._scored_until is not None else self._first_day
+        for day in pd.date_range(start, complete_until - pd.Timedelta(days=1), freq="D"):
+            totals = self._daily.get(day, dict.fromkeys(_TOTALS, 0))
+            values = {
+                "revenue": totals["revenue"],
+                "sessions": totals["sessions"],
+                "conversion_rate": totals["orders"] / totals["sessions"] if totals["sessions"] else None,
+                "refunds_per_item_sold": totals["refunded_items"] / totals["items"] if totals["items"] else None,
+            }
+
+            for metric, value in values.items():
+                if value is None:
+                    continue
+                band = self._bands.setdefault((metric, day.dayofweek), _Band())
+                bounds = band.bounds()
+                lower, upper = bounds if bounds else (None, None)
+                self._rows.append({
+                    "date": day,
+                    "metric": metric,
+                    "value": float(value),
+                    "expected": band.mean if bounds else None,
+                    "lower": lower,
+                    "upper": upper,
+                    "is_alert": bool(bounds) and not lower <= value <= upper,
+                })
+                band.update(float(value))
+
+        self._scored_until = max(start, complete_until)
+        if len(self._rows) != scored_rows:
+            self._frames = {}
+
+    # ------------------ Results ------------------
+    def daily_series(self, metric=None):
+        """Scored days: value, expected value and band, and the alert flag."""
+        with self._lock:
+            return self._frame(("series", metric), self._build_series, metric)
+
+    def alerts(self):
+        """Flagged days, newest first, with a readable description."""
+        with self._lock:
+            return self._frame(("alerts",), self._build_alerts)
+
+    def _frame(self, key, build, *args):
+        # Built at most once per scored batch; callers must not modify it
+        if key not in self._frames:
+            self._frames[key] = build(*args)
+        return self._frames[key]
+
+    def _build_series(self, metric):
+        if metric is not None:
+            series = self._frame(("series", None), self._build_series, None)
+            return series[series["metric"] == metric].reset_index(drop=True)
+
+        if not self._rows:
+            return pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in _SERIES_DTYPES.items()})
+        return pd.DataFrame(self._rows, columns=list(_SERIES_DTYPES))
+
+    def _build_alerts(self):
+        series = self._frame(("series", None), self._build_series, None)
+        flagged = series[series["is_alert"]].sort_values("date", ascending=False)
+
+        direction = (flagged["value"] > flagged["upper"]).map({True: "above", False: "below"})
+        flagged = flagged.assign(description=(
+            flagged["metric"].map(METRICS) + " " + direction + " expected on "
+            + flagged["date"].dt.strftime("%Y-%m-%d")
+        ))
+        return flagged.reset_index(drop=True)
+
+
+# Reset by clear_caches, i.e. whenever set_tables swaps the data
+_monitor = register(AlertMonitor())
+
+
+def refresh_alerts():
+    """Bring the shared monitor up to date with the loaded data and return its alerts."""
+    _monitor.refresh()
+    return _monitor.alerts()
+
+
+def daily_series(metric=None):
+    _monitor.refresh()
+    return _monitor.daily_series(metric)
@@ -0,0 +1,185 @@
+"""Local JSON API over the dashboard's compute functions.
+
+    python -m analytics.api --port 8502      (or: uvicorn analytics.api:app)
+
+Routes (GET/HEAD):
+
+    /filters                  selectable values for each filter
+    /queries                  query names, grouped by dashboard tab
+    /queries/<name>?year=2013&month=5&campaign=...&source=...&device=...
+    /alerts                   flagged days of the daily anomaly monitor
+
+Omitted filters mean "All". Responses carry an ETag; a request whose
+If-None-Match matches gets an empty 304. Serialised responses are memoised
+per query and selection, so repeated polls are served from memory.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+from urllib.parse import parse_qs
+
+from .alerts import refresh_alerts
+from .cache import memoize
+from .data import filter_options, load_data
+from .filters import ALL, Filters
+from .queries import TAB_QUERIES, plain_value
+
+QUERIES = {query.__name__: query for queries in TAB_QUERIES.values() for query in queries}
+
+FILTER_PARAMS = ("year", "month", "campaign", "source", "device")
+INTEGER_PARAMS = ("year", "month")
+
+
+class BadRequest(ValueError):
+    pass
+
+
+# ---------------------------------------------------------
+# Payloads
+# ---------------------------------------------------------
+def _payload(body):
+    """Encode a JSON body and derive its ETag from the content."""
+    data = body.encode("utf-8")
+    return data, '"' + hashlib.sha1(data).hexdigest() + '"'
+
+
+@memoize
+def filters_payload():
+    return _payload(json.dumps(filter_options()))
+
+
+@memoize
+def queries_payload():
+    return _payload(json.dumps({
+        tab: [query.__name__ for query in queries] for tab, queries in TAB_QUERIES.items()
+    }))
+
+
+@memoize
+def query_payload(name, filters):
+    result = QUERIES[name](filters)
+    if isinstance(result, dict):
+        body = json.dumps({key: plain_value(value) for key, value in result.items()})
+    else:
+        body = result.to_json(orient="records", date_format="iso")
+    return _payload(body)
+
+
+def etag_matches(if_none_match, etag):
+    """Whether an If-None-Match header value covers ``etag`` (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def parse_filters(query_string):
+    params = parse_qs(query_string)
+
+    unknown = set(params) - set(FILTER_PARAMS)
+    if unknown:
+        raise BadRequest(f"Unknown parameter(s): {', '.join(sorted(unknown))}")
+
+    values = {}
+    for param, given in params.items():
+        value = given[-1]
+        if param in INTEGER_PARAMS and value != ALL:
+            try:
+                value = int(value)
+            except ValueError:
+                raise BadRequest(f"{param} must be an integer or {ALL!r}") from None
+        values[param] = value
+    return Filters(**values)
+
+
+def route(path, query_string):
+    """Resolve a request to ``(status, body, etag)``."""
+    if path == "/filters":
+        return (200, *filters_payload())
+    if path == "/queries":
+        return (200, *queries_payload())
+    if path == "/alerts":
+        # Not memoised: each poll picks up newly arrived rows
+        return (200, *_payload(refresh_alerts().to_json(orient="records", date_format="iso")))
+
+    if path.startswith("/queries/"):
+        name = path[len("/queries/"):]
+        if name not in QUERIES:
+            return (404, *_payload(json.dumps({"error": f"Unknown query: {name}"})))
+        try:
+            filters = parse_filters(query_string)
+        except BadRequest as exc:
+            return (400, *_payload(json.dumps({"error": str(exc)})))
+        return (200, *query_payload(name, filters))
+
+    return (404, *_payload(json.dumps({"error": "Not found"})))
+
+
+# ---------------------------------------------------------
+# ASGI application
+# ---------------------------------------------------------
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    if scope["method"] not in ("GET", "HEAD"):
+        status, body, etag = (405, *_payload(json.dumps({"error": "Method not allowed"})))
+    else:
+        # Computations are blocking pandas work: keep them off the event loop
+        status, body, etag = await asyncio.to_thread(
+            route, scope["path"], scope["query_string"].decode("latin-1")
+        )
+
+    request_headers = dict(scope["headers"])
+    if status == 200 and etag_matches(request_headers.get(b"if-none-match", b"").decode("latin-1"), etag):
+        status, body = 304, b""
+
+    headers = [
+        (b"etag", etag.encode("latin-1")),
+        (b"cache-control", b"no-cache"),
+    ]
+    if status != 304:
+        headers += [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Load the data before the first request instead of during it
+            await asyncio.to_thread(load_data)
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+def main(argv=None):
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import threading
+from concurrent.futures import Future
+from functools import lru_cache, wraps
+
+# ---------------------------------------------------------
+# Per-function memoisation
+# ---------------------------------------------------------
+# Every compute function is keyed on its (hashable) arguments, usually a
+# Filters instance. Cached frames are shared between callers: treat them
+# as read-only.
+#
+# Calls are single-flight: while one thread computes a key, other callers
+# of the same key wait for that result instead of computing it again (e.g.
+# the dashboard rendering a tab the background prefetcher is warming).
+
+CACHE_SIZE = 128
+
+_cached_functions = []
+
+
+def memoize(func):
+    """Wrap ``func`` in a single-flight LRU cache and register it for ``clear_caches``."""
+    cached = lru_cache(maxsize=CACHE_SIZE)(func)
+    in_flight = {}
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args):
+        with lock:
+            future = in_flight.get(args)
+            owner = future is None
+            if owner:
+                future = in_flight[args] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = cached(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with lock:
+                del in_flight[args]
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return register(wrapper)
+
+
+def register(cache):
+    """Have ``clear_caches`` call ``cache.cache_clear()``; for caches not built by ``memoize``."""
+    _cached_functions.append(cache)
+    return cache
+
+
+def clear_caches():
+    """Drop every memoised result (e.g. after the underlying data changed)."""
+    for cached in _cached_functions:
+        cached.cache_clear()
@@ -0,0 +1,257 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# ---------------------------------------------------------
+# Dashboard charts
+# ---------------------------------------------------------
+# One figure builder per result frame, shared by the Streamlit app and the
+# static reports. Each takes the frame returned by the compute function of
+# the same name.
+
+
+# ------------------ Sales ------------------
+def revenue_by_year(yearly_rev):
+    fig_year = px.line(
+        yearly_rev,
+        x="year",
+        y="price_usd",
+        markers=True,
+        title="Revenue by Year",
+    )
+
+    # Update the layout and x-axis formatting
+    fig_year.update_layout(
+        xaxis=dict(
+            tickmode="linear",
+            tickformat="%Y"
+        ),
+        height=350
+    )
+    return fig_year
+
+
+def revenue_by_product(product_rev):
+    fig_pie = px.pie(
+        product_rev,
+        names="product_name",
+        values="price_usd",
+        title="Revenue Share by Product",
+    )
+    fig_pie.update_traces(textposition="inside", textinfo="percent+label")
+    fig_pie.update_layout(height=400)
+    return fig_pie
+
+
+def revenue_by_campaign(campaign_rev):
+    fig_campaign = px.bar(
+        campaign_rev,
+        x="utm_campaign",
+        y="price_usd",
+        title="Revenue by Campaign",
+        text_auto=True
+    )
+    fig_campaign.update_traces(texttemplate="%{y:.2s}", textposition="outside", cliponaxis=False)
+    fig_campaign.update_layout(xaxis_tickangle=45, height=350, margin=dict(t=80))
+    return fig_campaign
+
+
+def revenue_by_source(source_rev):
+    fig_source = px.bar(
+        source_rev,
+        x="utm_source",
+        y="price_usd",
+        title="Revenue by Traffic Source",
+        text_auto=True
+    )
+    fig_source.update_traces(texttemplate="%{y:.2s}", textposition="outside", cliponaxis=False)
+    fig_source.update_layout(xaxis_tickangle=45, height=350, margin=dict(t=80))
+    return fig_source
+
+
+# ------------------ Products ------------------
+def revenue_over_time_by_product(revenue_over_time):
+    fig_rev_product = px.line(
+        revenue_over_time,
+        x="date",
+        y="price_usd",
+        color="product_name",
+        markers=True,
+        title="Revenue Over Time by Product"
+    )
+    fig_rev_product.update_layout(height=400)
+    return fig_rev_product
+
+
+def conversion_by_product(orders_per_product):
+    fig_conv_product = px.bar(
+        orders_per_product,
+        x="product_name",
+        y="conversion_rate",
+        title="Conversion Rate by Product",
+        text=orders_per_product["conversion_rate"].apply(lambda x: f"{x*100:.2f}%")
+    )
+    fig_conv_product.update_layout(
+        xaxis_tickangle=45,
+        height=400,
+        yaxis_title="Conversion Rate"
+    )
+    return fig_conv_product
+
+
+# ------------------ Marketing ------------------
+def sessions_by_source(utm_source_counts):
+    fig_utm_pie = px.pie(
+        utm_source_counts,
+        names="utm_source",
+        values="sessions",
+        title="Website Sessions by UTM Source"
+    )
+    fig_utm_pie.update_traces(textposition="inside", textinfo="percent+label")
+    return fig_utm_pie
+
+
+def conversion_by_month(conv_over_time):
+    fig_conv_time = px.line(
+        conv_over_time,
+        x="month",
+        y="conversion_rate",
+        markers=True,
+        title="Monthly Conversion Rate Over Time"
+    )
+    fig_conv_time.update_layout(yaxis_title="Conversion Rate", height=400)
+    return fig_conv_time
+
+
+# ------------------ Website ------------------
+def bounce_by_month(monthly_bounce):
+    fig_bounce = px.line(
+        monthly_bounce,
+        x="month",
+        y="bounce_rate",
+        markers=True,
+        title="Monthly Bounce Rate Over Time"
+    )
+    fig_bounce.update_layout(
+        yaxis_title="Bounce Rate",
+        height=400
+    )
+    return fig_bounce
+
+
+def funnel(funnel_data):
+    return px.funnel(
+        funnel_data,
+        x="sessions",
+        y="funnel_stage",
+        title="Conversion Funnel by WebPage",
+        text=funnel_data["conversion_rate"].apply(lambda x: f"{x:.1%}"),
+        labels={"sessions": "Sessions", "funnel_stage": "Funnel Stage"}
+    )
+
+
+def sessions_by_device(device_data):
+    fig_device = px.pie(
+        device_data,
+        names="device_type",
+        values="sessions",
+        title="Sessions by Device Type"
+    )
+    fig_device.update_traces(textposition="inside", textinfo="percent+label")
+    fig_device.update_layout(height=400)
+    return fig_device
+
+
+def session_length_distribution(length_data):
+    fig_length = px.bar(
+        length_data,
+        x="session_length",
+        y="sessions",
+        title="Sessions by Time on Site",
+        text_auto=True
+    )
+    fig_length.update_layout(xaxis_title="Time on Site", yaxis_title="Sessions", height=400)
+    return fig_length
+
+
+TOP_TRANSITIONS = 25
+
+
+def page_transitions(transitions, top_n=TOP_TRANSITIONS):
+    """Sankey of the ``top_n`` most frequent page-to-page transitions."""
+    # Reloads of the same page would be a loop, which a Sankey cannot draw
+    top = transitions[transitions["from_url"] != transitions["to_url"]].head(top_n)
+
+    pages = pd.unique(pd.concat([top["from_url"], top["to_url"]]))
+    node = {page: i for i, page in enumerate(pages)}
+
+    fig_paths = go.Figure(go.Sankey(
+        node=dict(label=list(pages), pad=15, thickness=15),
+        link=dict(
+            source=top["from_url"].map(node).tolist(),
+            target=top["to_url"].map(node).tolist(),
+            value=top["transitions"].tolist(),
+            customdata=top["mean_seconds"].round(1).tolist(),
+            hovertemplate="%{source.label} → %{target.label}<br>"
+                          "%{value:,} transitions<br>%{customdata}s on page<extra></extra>",
+        ),
+    ))
+    fig_paths.update_layout(title=f"Top {top_n} Page-to-Page Transitions", height=500)
+    return fig_paths
+
+
+# ------------------ Alerts ------------------
+def daily_monitor(series, title):
+    """Daily values of one metric with the expected band and flagged days."""
+    fig_monitor = go.Figure()
+    fig_monitor.add_scatter(x=series["date"], y=series["upper"], mode="lines",
+                            line=dict(width=0), showlegend=False, hoverinfo="skip")
+    fig_monitor.add_scatter(x=series["date"], y=series["lower"], mode="lines",
+                            line=dict(width=0), fill="tonexty", fillcolor="rgba(163,196,243,0.4)",
+                            name="Expected range", hoverinfo="skip")
+    fig_monitor.add_scatter(x=series["date"], y=series["value"], mode="lines", name="Actual")
+
+    flagged = series[series["is_alert"]]
+    fig_monitor.add_scatter(x=flagged["date"], y=flagged["value"], mode="markers", name="Alert",
+                            marker=dict(color="red", size=9, symbol="x"))
+    fig_monitor.update_layout(title=title, height=400)
+    return fig_monitor
+
+
+def add_alert_markers(fig, frame, x, y, alerts):
+    """Mark the points of a monthly series whose month had alerts."""
+    if alerts.empty:
+        return fig
+
+    months = alerts["date"].dt.to_period("M").dt.to_timestamp()
+    summary = alerts.groupby(months)["description"].agg("<br>".join)
+
+    flagged = frame[frame[x].isin(summary.index)]
+    fig.add_scatter(
+        x=flagged[x],
+        y=flagged[y],
+        mode="markers",
+        name="Alert",
+        marker=dict(color="red", size=12, symbol="x"),
+        hovertext=flagged[x].map(summary),
+        hoverinfo="text",
+    )
+    return fig
+
+
+# Chart builder for each compute function that has one, by function name
+CHARTS = {
+    "revenue_by_year": revenue_by_year,
+    "revenue_by_product": revenue_by_product,
+    "revenue_by_campaign": revenue_by_campaign,
+    "revenue_by_source": revenue_by_source,
+    "revenue_over_time_by_product": revenue_over_time_by_product,
+    "conversion_by_product": conversion_by_product,
+    "sessions_by_source": sessions_by_source,
+    "conversion_by_month": conversion_by_month,
+    "bounce_by_month": bounce_by_month,
+    "funnel": funnel,
+    "sessions_by_device": sessions_by_device,
+    "session_length_distribution": session_length_distribution,
+    "page_transitions": page_transitions,
+}
@@ -0,0 +1,138 @@
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import pandas as pd
+
+from .cache import clear_caches, memoize
+
+# ---------------------------------------------------------
+# Data sources
+# ---------------------------------------------------------
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+# Large CSVs from Hugging Face (direct download)
+SESSIONS_URL = "https://huggingface.co/datasets/Snap-mango01/toy-ecommerce-data/resolve/main/website_sessions_clean.csv?download=1"
+PAGEVIEWS_URL = "https://huggingface.co/datasets/Snap-mango01/toy-ecommerce-data/resolve/main/website_pageviews.csv?download=1"
+
+# Low-cardinality text columns kept dictionary-encoded (pandas "category"):
+# one sorted table of distinct values per column, rows hold int8/int16 codes
+ENCODED_COLUMNS = {
+    "website_sessions": ("utm_source", "utm_campaign", "device_type"),
+    "pageviews": ("pageview_url",),
+}
+
+Tables = namedtuple(
+    "Tables",
+    ["orders", "order_items", "products", "refunds", "website_sessions", "pageviews"],
+)
+
+
+_tables = None
+_tables_lock = threading.Lock()
+
+
+# ---------------------------------------------------------
+# Load Data
+# ---------------------------------------------------------
+def load_data():
+    """Every table, read on first use and then shared by all compute functions.
+
+    Callers must not modify the returned frames in place.
+    """
+    global _tables
+    with _tables_lock:
+        if _tables is None:
+            _tables = read_tables()
+        return _tables
+
+
+def set_tables(tables):
+    """Serve ``tables`` from ``load_data`` and drop every memoised result."""
+    global _tables
+    with _tables_lock:
+        _tables = tables
+    clear_caches()
+
+
+def read_tables():
+    """Read all CSVs and parse their date columns."""
+    # Small CSVs stored in GitHub
+    orders = pd.read_csv(DATA_DIR / "orders.csv")
+    order_items = pd.read_csv(DATA_DIR / "order_items.csv")
+    products = pd.read_csv(DATA_DIR / "products.csv")
+    refunds = pd.read_csv(DATA_DIR / "order_item_refunds.csv")
+
+    # Encoded columns are parsed straight into codes, never as Python strings
+    website_sessions = pd.read_csv(
+        SESSIONS_URL,
+        dtype={column: "category" for column in ENCODED_COLUMNS["website_sessions"]},
+    )
+    pageviews = pd.read_csv(
+        PAGEVIEWS_URL,
+        dtype={column: "category" for column in ENCODED_COLUMNS["pageviews"]},
+    )
+    for frame, table in ((website_sessions, "website_sessions"), (pageviews, "pageviews")):
+        for column in ENCODED_COLUMNS[table]:
+            frame[column] = frame[column].cat.reorder_categories(
+                sorted(frame[column].cat.categories)
+            )
+
+    # Date Columns Prep
+    orders["created_at"] = pd.to_datetime(orders["created_at"])
+    orders["year"] = orders["created_at"].dt.year
+    orders["month"] = orders["created_at"].dt.month
+
+    website_sessions["created_at"] = pd.to_datetime(website_sessions["created_at"])
+    pageviews["created_at"] = pd.to_datetime(pageviews["created_at"])
+
+    return Tables(orders, order_items, products, refunds, website_sessions, pageviews)
+
+
+# ---------------------------------------------------------
+# Code tables
+# ---------------------------------------------------------
+@memoize
+def dictionaries():
+    """The sorted value table of every dictionary-encoded column, by column name."""
+    tables = load_data()
+    return {
+        column: getattr(tables, table)[column].cat.categories
+        for table, columns in ENCODED_COLUMNS.items()
+        for column in columns
+    }
+
+
+# ---------------------------------------------------------
+# Site totals
+# ---------------------------------------------------------
+@memoize
+def site_totals():
+    """Unfiltered session, user and pageview counts shared by several tabs."""
+    tables = load_data()
+    sessions = tables.website_sessions
+
+    return {
+        "total_sessions": sessions["website_session_id"].nunique(),
+        "unique_users": sessions["user_id"].nunique(),
+        "total_pageviews": tables.pageviews.shape[0],
+    }
+
+
+# ---------------------------------------------------------
+# Sidebar filter options
+# ---------------------------------------------------------
+@memoize
+def filter_options():
+    """Selectable values for each sidebar filter, each list starting with "All"."""
+    orders = load_data().orders
+    codes = dictionaries()
+
+    return {
+        "years": ["All"] + sorted(orders["year"].unique().tolist()),
+        "months": ["All"] + sorted(orders["month"].unique().tolist()),
+        # Served from the code tables: no scan of the session rows
+        "utm_campaigns": ["All"] + codes["utm_campaign"].tolist(),
+        "utm_sources": ["All"] + codes["utm_source"].tolist(),
+        "device_types": ["All"] + codes["device_type"].tolist(),
+    }
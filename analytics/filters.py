@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+
+import pandas as pd
+
+from .cache import memoize
+from .data import load_data
+
+ALL = "All"
+
+
+@dataclass(frozen=True)
+class Filters:
+    """The sidebar selection. Hashable, so it can key the compute caches."""
+
+    year: object = ALL
+    month: object = ALL
+    campaign: object = ALL
+    source: object = ALL
+    device: object = ALL
+
+
+# ---------------------------------------------------------
+# Apply Filters
+# ---------------------------------------------------------
+# Each base table is cached on the filters it actually depends on, so e.g.
+# switching the month reuses the segment's sessions.
+def filtered_orders(filters):
+    """Orders restricted to the selected year and month."""
+    return _orders_in_period(filters.year, filters.month)
+
+
+@memoize
+def _orders_in_period(year, month):
+    orders = load_data().orders
+
+    mask = pd.Series(True, index=orders.index)
+    if year != ALL:
+        mask &= orders["year"] == year
+    if month != ALL:
+        mask &= orders["month"] == month
+
+    return orders[mask]
+
+
+def filtered_sessions(filters):
+    """Website sessions restricted to the selected campaign, source and device."""
+    return _sessions_in_segment(filters.campaign, filters.source, filters.device)
+
+
+@memoize
+def _sessions_in_segment(campaign, source, device):
+    sessions = load_data().website_sessions
+
+    mask = pd.Series(True, index=sessions.index)
+    if campaign != ALL:
+        mask &= _code_equals(sessions["utm_campaign"], campaign)
+    if source != ALL:
+        mask &= _code_equals(sessions["utm_source"], source)
+    if device != ALL:
+        mask &= _code_equals(sessions["device_type"], device)
+
+    return sessions[mask]
+
+
+def _code_equals(column, value):
+    """Compare a dictionary-encoded column on its integer codes."""
+    categories = column.cat.categories
+    if value not in categories:
+        return pd.Series(False, index=column.index)
+    return column.cat.codes == categories.get_loc(value)
+
+
+def order_lines(filters):
+    """Order items of the filtered orders, with order dates, session and product name."""
+    return _order_lines_in_period(filters.year, filters.month)
+
+
+@memoize
+def _order_lines_in_period(year, month):
+    tables = load_data()
+
+    lines = tables.order_items.merge(
+        _orders_in_period(year, month)[["order_id", "created_at", "year", "month", "website_session_id"]],
+        on="order_id",
+        how="inner",
+        suffixes=("_item", ""),
+    )
+    return lines.merge(tables.products[["product_id", "product_name"]],
+                       on="product_id", how="left")
+
+
+@memoize
+def selected_sessions(filters):
+    """Website sessions matching every sidebar filter.
+
+    Year and month are applied to the session start, so session-level
+    analytics follow the same period as the order metrics.
+    """
+    sessions = filtered_sessions(filters)
+
+    mask = pd.Series(True, index=sessions.index)
+    if filters.year != ALL:
+        mask &= sessions["created_at"].dt.year == filters.year
+    if filters.month != ALL:
+        mask &= sessions["created_at"].dt.month == filters.month
+
+    return sessions[mask]
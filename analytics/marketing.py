@@ -0,0 +1,74 @@
+from .cache import memoize
+from .data import load_data, site_totals
+from .filters import filtered_orders
+
+# ---------------------------------------------------------
+# MARKETING DASHBOARD
+# ---------------------------------------------------------
+
+
+@memoize
+def marketing_kpis(filters):
+    """Unique users, traffic, customer conversion and repeat user rate."""
+    orders = filtered_orders(filters)
+    totals = site_totals()
+
+    unique_users = totals["unique_users"]
+    total_traffic = totals["total_sessions"]
+
+    # Customers who purchased / unique users who visited the site
+    unique_purchasers = orders["user_id"].nunique()
+    customer_conversion_rate = unique_purchasers / unique_users if unique_users > 0 else 0
+
+    user_order_counts = orders.groupby("user_id")["order_id"].nunique()
+    repeat_user_rate = (user_order_counts > 1).mean() if not user_order_counts.empty else 0
+
+    return {
+        "unique_users": unique_users,
+        "total_traffic": total_traffic,
+        "customer_conversion_rate": customer_conversion_rate,
+        "repeat_user_rate": repeat_user_rate,
+    }
+
+
+def sessions_by_source(filters):
+    # Does not depend on the filters: computed once
+    return _sessions_by_source()
+
+
+@memoize
+def _sessions_by_source():
+    return (
+        load_data().website_sessions.groupby("utm_source", observed=True)["website_session_id"]
+        .nunique()
+        .reset_index(name="sessions")
+        .sort_values("sessions", ascending=False)
+    )
+
+
+@memoize
+def _sessions_per_month():
+    sessions = load_data().website_sessions
+    return (
+        sessions.groupby(sessions["created_at"].dt.to_period("M").dt.to_timestamp().rename("month"))
+        ["website_session_id"].nunique()
+        .reset_index(name="sessions")
+    )
+
+
+@memoize
+def conversion_by_month(filters):
+    """Monthly orders over monthly sessions."""
+    orders = filtered_orders(filters)
+
+    # Total orders per month
+    orders_per_month = (
+        orders.groupby(orders["created_at"].dt.to_period("M").dt.to_timestamp().rename("month"))
+        ["order_id"].nunique()
+        .reset_index(name="orders")
+    )
+
+    conv_over_time = _sessions_per_month().merge(orders_per_month, on="month", how="left")
+    conv_over_time["orders"] = conv_over_time["orders"].fillna(0)
+    conv_over_time["conversion_rate"] = conv_over_time["orders"] / conv_over_time["sessions"]
+    return conv_over_time
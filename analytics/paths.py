@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+from .cache import memoize
+from .data import load_data
+from .filters import selected_sessions
+
+# ---------------------------------------------------------
+# SESSION TIME-ON-SITE AND PAGE PATHS
+# ---------------------------------------------------------
+# Pageviews are sorted by session and time once. Every metric then comes
+# from comparing that order with itself shifted by one row: consecutive
+# rows of the same session are a page-to-page transition, and session
+# boundaries give first/last views. No per-session Python loops.
+
+# Session length buckets (seconds from first to last pageview)
+DURATION_BINS = [0, 60, 180, 300, 600, 1800, np.inf]
+DURATION_LABELS = ["< 1 min", "1-3 min", "3-5 min", "5-10 min", "10-30 min", "30+ min"]
+SINGLE_PAGE = "Single page"
+
+
+@memoize
+def _sorted_pageviews():
+    """Session ids, view times (epoch seconds) and URL codes in session/time order."""
+    pageviews = load_data().pageviews.sort_values(
+        ["website_session_id", "created_at"], kind="stable"
+    )
+
+    # Work on the dictionary codes; missing URLs (-1) get a slot of their own
+    urls = np.append(pageviews["pageview_url"].cat.categories.to_numpy(dtype=object), None)
+    url_codes = pageviews["pageview_url"].cat.codes.to_numpy()
+    url_codes = np.where(url_codes < 0, len(urls) - 1, url_codes)
+
+    return (
+        pageviews["website_session_id"].to_numpy(),
+        pageviews["created_at"].to_numpy("datetime64[s]").astype(np.int64),
+        url_codes,
+        urls,
+    )
+
+
+def _empty_paths():
+    per_session = pd.DataFrame({
+        "website_session_id": np.array([], dtype=np.int64),
+        "pageviews": np.array([], dtype=np.int32),
+        "duration_seconds": np.array([], dtype=np.int32),
+    })
+    per_transition = pd.DataFrame({
+        "from_url": np.array([], dtype=object),
+        "to_url": np.array([], dtype=object),
+        "transitions": np.array([], dtype=np.int64),
+        "mean_seconds": np.array([], dtype=np.float64),
+    })
+    return per_session, per_transition
+
+
+@memoize
+def _session_paths(filters):
+    session_ids, seconds, url_codes, urls = _sorted_pageviews()
+
+    keep = np.isin(session_ids, selected_sessions(filters)["website_session_id"].to_numpy())
+    session_ids, seconds, url_codes = session_ids[keep], seconds[keep], url_codes[keep]
+
+    if not len(session_ids):
+        return _empty_paths()
+
+    # ------------------ Per session ------------------
+    is_start = np.ones(len(session_ids), dtype=bool)
+    is_start[1:] = session_ids[1:] != session_ids[:-1]
+    starts = np.flatnonzero(is_start)
+    ends = np.append(starts[1:], len(session_ids)) - 1
+
+    per_session = pd.DataFrame({
+        "website_session_id": session_ids[starts],
+        "pageviews": (ends - starts + 1).astype(np.int32),
+        "duration_seconds": (seconds[ends] - seconds[starts]).astype(np.int32),
+    })
+
+    # ------------------ Per transition ------------------
+    same_session = ~is_start[1:]
+    from_codes = url_codes[:-1][same_session]
+    to_codes = url_codes[1:][same_session]
+    gaps = (seconds[1:] - seconds[:-1])[same_session]
+
+    n_urls = len(urls)
+    pair = from_codes.astype(np.int64) * n_urls + to_codes
+    counts = np.bincount(pair, minlength=n_urls * n_urls)
+    total_gaps = np.bincount(pair, weights=gaps, minlength=n_urls * n_urls)
+
+    observed = np.flatnonzero(counts)
+    per_transition = pd.DataFrame({
+        "from_url": urls[observed // n_urls],
+        "to_url": urls[observed % n_urls],
+        "transitions": counts[observed],
+        "mean_seconds": total_gaps[observed] / counts[observed],
+    }).sort_values("transitions", ascending=False, ignore_index=True)
+
+    return per_session, per_transition
+
+
+@memoize
+def session_durations(filters):
+    """One row per selected session: pageview count and first-to-last seconds."""
+    return _session_paths(filters)[0]
+
+
+@memoize
+def page_transitions(filters):
+    """Consecutive page pairs within sessions, most frequent first.
+
+    ``mean_seconds`` is the average time spent on ``from_url`` before
+    moving to ``to_url``.
+    """
+    return _session_paths(filters)[1]
+
+
+@memoize
+def time_on_site_kpis(filters):
+    per_session, per_transition = _session_paths(filters)
+    multi_page = per_session[per_session["pageviews"] > 1]
+
+    total_transitions = per_transition["transitions"].sum()
+    total_gap_seconds = (per_transition["transitions"] * per_transition["mean_seconds"]).sum()
+
+    return {
+        "avg_session_seconds": per_session["duration_seconds"].mean() if not per_session.empty else 0,
+        "median_multi_page_session_seconds": multi_page["duration_seconds"].median() if not multi_page.empty else 0,
+        "avg_pages_per_session": per_session["pageviews"].mean() if not per_session.empty else 0,
+        "avg_seconds_between_pages": total_gap_seconds / total_transitions if total_transitions > 0 else 0,
+    }
+
+
+@memoize
+def session_length_distribution(filters):
+    """Selected sessions per session length bucket, single-page sessions apart."""
+    per_session = session_durations(filters)
+    multi_page = per_session["pageviews"] > 1
+
+    buckets = pd.cut(
+        per_session.loc[multi_page, "duration_seconds"],
+        bins=DURATION_BINS,
+        labels=DURATION_LABELS,
+        right=False,
+    )
+    counts = buckets.value_counts(sort=False)
+
+    return pd.DataFrame({
+        "session_length": [SINGLE_PAGE] + DURATION_LABELS,
+        "sessions": [int((~multi_page).sum())] + [int(counts[label]) for label in DURATION_LABELS],
+    })
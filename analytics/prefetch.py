@@ -0,0 +1,135 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from .filters import ALL
+from .queries import TAB_QUERIES
+
+# ---------------------------------------------------------
+# Background precompute
+# ---------------------------------------------------------
+# Results land in the same memoised caches the dashboard reads from, so a
+# tab switch after warming is a cache hit instead of a cold merge-and-groupby.
+
+MAX_WORKERS = 4
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _shared_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                           thread_name_prefix="analytics-prefetch")
+        return _executor
+
+
+def adjacent_filters(filters, options):
+    """Selections one step away in month or year: the likeliest next picks."""
+    neighbours = []
+    for field, key in (("month", "months"), ("year", "years")):
+        value = getattr(filters, field)
+        if value == ALL:
+            continue
+
+        values = [v for v in options[key] if v != ALL]
+        if value not in values:
+            continue
+
+        i = values.index(value)
+        for j in (i + 1, i - 1):
+            if 0 <= j < len(values):
+                neighbours.append(replace(filters, **{field: values[j]}))
+
+    return neighbours
+
+
+class Prefetcher:
+    """Warms every tab's results for one user's current filter selection.
+
+    Keep one instance per user session. Work runs on a process-wide thread
+    pool; switching to new filters cancels whatever is still queued for the
+    previous selection.
+    """
+
+    def __init__(self, executor=None):
+        self._executor = executor
+        self._filters = None
+        self._generation = 0
+        self._futures = []
+        self._deferred = []
+        # Re-entrant: cancelling a future runs its done-callbacks in this thread
+        self._lock = threading.RLock()
+
+    def warm(self, filters, options=None, skip_tab=None):
+        """Queue the other tabs for ``filters``, then speculatively its neighbours.
+
+        ``skip_tab`` (a ``TAB_QUERIES`` key) is the tab being rendered: the
+        caller computes it in the foreground, so it is not queued for the
+        current selection. Neighbouring selections (``options`` is the
+        ``filter_options()`` dict) are only queued once the current one has
+        finished, so they never compete with it. Warming the same selection
+        twice is a no-op.
+        """
+        with self._lock:
+            if filters == self._filters:
+                return
+
+            # Bump the generation first: cancelled futures run their callbacks
+            self._generation += 1
+            generation = self._generation
+            self._cancel_pending()
+            self._filters = filters
+
+            current = [
+                query
+                for tab, queries in TAB_QUERIES.items() if tab != skip_tab
+                for query in queries
+            ]
+            self._deferred = adjacent_filters(filters, options) if options is not None else []
+            remaining = len(current)
+
+            def current_done(_future):
+                nonlocal remaining
+                with self._lock:
+                    remaining -= 1
+                    if remaining == 0 and generation == self._generation:
+                        self._submit_deferred()
+
+            if not current:
+                self._submit_deferred()
+            for query in current:
+                self._submit(query, filters).add_done_callback(current_done)
+
+    def cancel(self):
+        """Drop queued work. Queries already running finish and stay cached."""
+        with self._lock:
+            self._generation += 1
+            self._cancel_pending()
+            self._filters = None
+
+    def pending(self):
+        """Queries queued, running or waiting for the current selection to finish."""
+        with self._lock:
+            deferred = len(self._deferred) * sum(len(queries) for queries in TAB_QUERIES.values())
+            return deferred + sum(not future.done() for future in self._futures)
+
+    def _submit(self, query, selection):
+        future = (self._executor or _shared_executor()).submit(query, selection)
+        self._futures.append(future)
+        return future
+
+    def _submit_deferred(self):
+        selections, self._deferred = self._deferred, []
+        for selection in selections:
+            for queries in TAB_QUERIES.values():
+                for query in queries:
+                    self._submit(query, selection)
+
+    def _cancel_pending(self):
+        self._deferred = []
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.cancel()
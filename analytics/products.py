@@ -0,0 +1,76 @@
+import pandas as pd
+
+from .cache import memoize
+from .data import load_data, site_totals
+from .filters import order_lines
+
+# ---------------------------------------------------------
+# PRODUCT DASHBOARD
+# ---------------------------------------------------------
+
+
+@memoize
+def product_kpis(filters):
+    """Best seller, unit counts and refund figures for the filtered orders."""
+    tables = load_data()
+    prod_data = order_lines(filters)
+
+    refunds_merged = prod_data.merge(
+        tables.refunds[["order_item_id", "refund_amount_usd"]],
+        on="order_item_id",
+        how="left"
+    )
+    refunds_merged["refund_amount_usd"] = refunds_merged["refund_amount_usd"].fillna(0)
+
+    total_units_sold = prod_data.shape[0]
+    refunded_units = int((refunds_merged["refund_amount_usd"] > 0).sum())
+    refund_rate = refunded_units / total_units_sold if total_units_sold > 0 else 0
+
+    total_refund_amount = refunds_merged["refund_amount_usd"].sum()
+    total_revenue_products = prod_data["price_usd"].sum()
+    pct_revenue_lost = total_refund_amount / total_revenue_products if total_revenue_products > 0 else 0
+
+    product_counts = prod_data["product_name"].value_counts()
+
+    return {
+        "top_product": product_counts.idxmax() if not product_counts.empty else None,
+        "total_products": tables.products["product_id"].nunique(),
+        "total_units_sold": total_units_sold,
+        "refund_rate": refund_rate,
+        "total_refund_amount": total_refund_amount,
+        "pct_revenue_lost": pct_revenue_lost,
+    }
+
+
+@memoize
+def revenue_over_time_by_product(filters):
+    revenue_over_time = (
+        order_lines(filters).groupby(["year", "month", "product_name"])["price_usd"]
+        .sum()
+        .reset_index()
+    )
+
+    revenue_over_time["date"] = pd.to_datetime(
+        revenue_over_time["year"].astype(str) + "-" +
+        revenue_over_time["month"].astype(str) + "-01"
+    )
+    return revenue_over_time
+
+
+@memoize
+def conversion_by_product(filters):
+    """Orders per product over all website sessions."""
+    total_sessions = site_totals()["total_sessions"]
+
+    orders_per_product = (
+        order_lines(filters).groupby("product_name")["order_id"]
+        .nunique()
+        .reset_index()
+        .rename(columns={"order_id": "orders"})
+    )
+
+    orders_per_product["sessions"] = total_sessions
+    orders_per_product["conversion_rate"] = (
+        orders_per_product["orders"] / total_sessions
+    )
+    return orders_per_product
@@ -0,0 +1,27 @@
+from .marketing import conversion_by_month, marketing_kpis, sessions_by_source
+from .paths import page_transitions, session_length_distribution, time_on_site_kpis
+from .products import conversion_by_product, product_kpis, revenue_over_time_by_product
+from .sales import (
+    revenue_by_campaign,
+    revenue_by_product,
+    revenue_by_source,
+    revenue_by_year,
+    sales_kpis,
+)
+from .website import bounce_by_month, funnel, sessions_by_device, website_kpis
+
+# Compute functions behind each dashboard tab, in display order
+TAB_QUERIES = {
+    "sales": (sales_kpis, revenue_by_year, revenue_by_product, revenue_by_campaign, revenue_by_source),
+    "products": (product_kpis, revenue_over_time_by_product, conversion_by_product),
+    "marketing": (marketing_kpis, sessions_by_source, conversion_by_month),
+    "website": (
+        website_kpis, bounce_by_month, funnel, sessions_by_device,
+        time_on_site_kpis, session_length_distribution, page_transitions,
+    ),
+}
+
+
+def plain_value(value):
+    """A numpy scalar KPI as the matching Python value (JSON-serialisable); others unchanged."""
+    return value.item() if hasattr(value, "item") else value
@@ -0,0 +1,202 @@
+"""Render every dashboard KPI and chart to static files, without Streamlit.
+
+    python -m analytics.report --out reports --period month --by device
+
+writes one folder per filter combination (KPIs as JSON/CSV, every result
+frame as CSV, charts as a single HTML page and optionally PNG) plus a
+top-level index.html linking them all. plotly.js is written once, next to
+the top-level index.html, so the reports also open offline.
+"""
+
+import argparse
+import html
+import importlib.util
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from pathlib import Path
+
+import pandas as pd
+
+from .data import filter_options, load_data, set_tables
+from .filters import ALL, Filters
+from .queries import TAB_QUERIES, plain_value
+from .snapshot import read_snapshot, write_snapshot
+
+PLOTLY_JS = "plotly.min.js"
+
+SEGMENTS = {
+    "campaign": "utm_campaigns",
+    "source": "utm_sources",
+    "device": "device_types",
+}
+
+
+# ---------------------------------------------------------
+# Filter combinations
+# ---------------------------------------------------------
+def report_filters(period="all", by=()):
+    """Every Filters selection for a period granularity crossed with segments.
+
+    ``period`` is "all", "year" or "month" (each year-month with orders).
+    ``by`` names sidebar segments ("campaign", "source", "device"); each
+    contributes all of its values plus the "All" total.
+    """
+    orders = load_data().orders
+    options = filter_options()
+
+    if period == "all":
+        periods = [(ALL, ALL)]
+    elif period == "year":
+        periods = [(year, ALL) for year in options["years"] if year != ALL]
+    elif period == "month":
+        year_months = orders[["year", "month"]].drop_duplicates().sort_values(["year", "month"])
+        periods = [(int(year), int(month)) for year, month in year_months.itertuples(index=False)]
+    else:
+        raise ValueError(f"Unknown period: {period!r}")
+
+    segment_values = [options[SEGMENTS[segment]] for segment in by]
+
+    selections = []
+    for (year, month), values in product(periods, product(*segment_values)):
+        selections.append(Filters(year=year, month=month, **dict(zip(by, values))))
+    return selections
+
+
+def slug(filters):
+    parts = [f"{filters.year}-{filters.month}", filters.campaign, filters.source, filters.device]
+    return "_".join(str(part).replace("/", "-").replace(" ", "-") for part in parts)
+
+
+# ---------------------------------------------------------
+# Rendering (runs in the worker processes)
+# ---------------------------------------------------------
+def _init_worker(snapshot_dir):
+    set_tables(read_snapshot(snapshot_dir))
+
+
+def _write_plotly_js(out_dir):
+    from plotly.offline import get_plotlyjs
+
+    path = Path(out_dir) / PLOTLY_JS
+    if not path.exists():
+        path.write_text(get_plotlyjs(), encoding="utf-8")
+
+
+def render_report(filters, out_dir, png=False):
+    """Compute every tab for ``filters`` and write its files; returns the folder."""
+    from . import charts
+
+    _write_plotly_js(out_dir)
+    folder = Path(out_dir) / slug(filters)
+    folder.mkdir(parents=True, exist_ok=True)
+
+    kpis = {}
+    sections = []
+    for tab, queries in TAB_QUERIES.items():
+        sections.append(f"<h2>{html.escape(tab.title())}</h2>")
+
+        for query in queries:
+            name = query.__name__
+            result = query(filters)
+
+            if isinstance(result, dict):
+                tab_kpis = {key: plain_value(value) for key, value in result.items()}
+                kpis.update(tab_kpis)
+                sections.append(pd.Series(tab_kpis, name="value").to_frame().to_html())
+                continue
+
+            result.to_csv(folder / f"{name}.csv", index=False)
+
+            chart = charts.CHARTS.get(name)
+            if chart is None:
+                continue
+            fig = chart(result)
+            sections.append(fig.to_html(full_html=False, include_plotlyjs=False))
+            if png:
+                # Needs the optional kaleido package
+                fig.write_image(folder / f"{name}.png")
+
+    (folder / "kpis.json").write_text(json.dumps(kpis, indent=2, default=str))
+    pd.Series(kpis, name="value").to_csv(folder / "kpis.csv", index_label="kpi")
+
+    title = html.escape(f"Ecommerce Toys Dashboard — {slug(filters)}")
+    (folder / "index.html").write_text(
+        f"<html><head><meta charset='utf-8'><title>{title}</title>"
+        f"<script src='../{PLOTLY_JS}'></script></head>"
+        f"<body><h1>{title}</h1>{''.join(sections)}</body></html>",
+        encoding="utf-8",
+    )
+    return folder
+
+
+# ---------------------------------------------------------
+# Batch
+# ---------------------------------------------------------
+def render_reports(selections, out_dir, png=False, workers=None, progress=None):
+    """Render ``selections`` on a process pool, one task per selection.
+
+    Data is loaded once here and handed to the workers as a memory-mapped
+    snapshot, so they share its pages instead of each reading the CSVs.
+    ``progress(done, total, folder)`` is called as each report completes.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Written before the workers start, so they never race on it
+    _write_plotly_js(out_dir)
+
+    folders = []
+    with tempfile.TemporaryDirectory(prefix="analytics-snapshot-") as snapshot_dir:
+        write_snapshot(load_data(), snapshot_dir)
+
+        with ProcessPoolExecutor(
+            # Each worker maps the snapshot: never start more than there are tasks
+            max_workers=min(workers or os.cpu_count(), max(len(selections), 1)),
+            initializer=_init_worker,
+            initargs=(snapshot_dir,),
+        ) as pool:
+            futures = [pool.submit(render_report, selection, out_dir, png) for selection in selections]
+            for done, future in enumerate(as_completed(futures), start=1):
+                folder = future.result()
+                folders.append(folder)
+                if progress is not None:
+                    progress(done, len(futures), folder)
+
+    links = "".join(
+        f"<li><a href='{folder.name}/index.html'>{html.escape(folder.name)}</a></li>"
+        for folder in sorted(folders)
+    )
+    (out_dir / "index.html").write_text(
+        f"<html><head><meta charset='utf-8'><title>Reports</title></head>"
+        f"<body><h1>Ecommerce Toys Dashboard reports</h1><ul>{links}</ul></body></html>",
+        encoding="utf-8",
+    )
+    return folders
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--out", default="reports", help="output directory (default: reports)")
+    parser.add_argument("--period", choices=["all", "year", "month"], default="month",
+                        help="time granularity of the report set (default: month)")
+    parser.add_argument("--by", action="append", choices=sorted(SEGMENTS), default=[],
+                        help="also split by this sidebar segment; repeatable")
+    parser.add_argument("--png", action="store_true", help="also write PNG charts (requires kaleido)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.png and importlib.util.find_spec("kaleido") is None:
+        parser.error("--png needs the kaleido package: pip install kaleido")
+
+    def show_progress(done, total, folder):
+        print(f"[{done}/{total}] {folder}")
+
+    selections = report_filters(args.period, list(dict.fromkeys(args.by)))
+    render_reports(selections, args.out, png=args.png, workers=args.workers, progress=show_progress)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+from .cache import memoize
+from .data import load_data
+from .filters import filtered_orders, order_lines
+
+# ---------------------------------------------------------
+# SALES DASHBOARD
+# ---------------------------------------------------------
+
+
+@memoize
+def sales_kpis(filters):
+    """Total revenue, order count and average order value."""
+    total_revenue = order_lines(filters)["price_usd"].sum()
+    total_orders = filtered_orders(filters)["order_id"].nunique()
+    aov = total_revenue / total_orders if total_orders > 0 else 0
+
+    return {
+        "total_revenue": total_revenue,
+        "total_orders": total_orders,
+        "aov": aov,
+    }
+
+
+@memoize
+def revenue_by_year(filters):
+    yearly_rev = (
+        order_lines(filters).groupby("year")["price_usd"]
+        .sum()
+        .reset_index()
+    )
+
+    # Make sure the year is an integer
+    yearly_rev["year"] = yearly_rev["year"].astype(int)
+    return yearly_rev
+
+
+@memoize
+def revenue_by_product(filters):
+    return (
+        order_lines(filters).groupby("product_name")["price_usd"]
+        .sum()
+        .reset_index()
+        .sort_values("price_usd", ascending=False)
+    )
+
+
+@memoize
+def _revenue_with_sessions(filters):
+    return order_lines(filters).merge(
+        load_data().website_sessions[["website_session_id", "utm_campaign", "utm_source"]],
+        on="website_session_id",
+        how="left"
+    )
+
+
+@memoize
+def revenue_by_campaign(filters):
+    return (
+        _revenue_with_sessions(filters).groupby("utm_campaign", observed=True)["price_usd"]
+        .sum()
+        .reset_index()
+        .sort_values("price_usd", ascending=False)
+    )
+
+
+@memoize
+def revenue_by_source(filters):
+    return (
+        _revenue_with_sessions(filters).groupby("utm_source", observed=True)["price_usd"]
+        .sum()
+        .reset_index()
+        .sort_values("price_usd", ascending=False)
+    )
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .data import Tables
+
+# ---------------------------------------------------------
+# Memory-mapped table snapshots
+# ---------------------------------------------------------
+# One .npy file per column, so worker processes can map the same pages
+# read-only instead of each re-reading (or unpickling) the full CSVs.
+# Dictionary-encoded columns keep their codes (memory-mapped too); other
+# text columns are stored as codes plus distinct values and decoded back to
+# strings on load.
+
+
+def write_snapshot(tables, directory):
+    """Write ``tables`` under ``directory`` and return its path."""
+    directory = Path(directory)
+
+    for name, frame in zip(Tables._fields, tables):
+        table_dir = directory / name
+        table_dir.mkdir(parents=True, exist_ok=True)
+        (table_dir / "columns.txt").write_text("\n".join(frame.columns))
+
+        for i, column in enumerate(frame.columns):
+            values = frame[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                np.save(table_dir / f"{i}.cat.npy", values.cat.codes.to_numpy())
+                np.save(table_dir / f"{i}.values.npy",
+                        values.cat.categories.to_numpy(dtype=object))
+            elif values.dtype.kind not in "biufmM":
+                codes, uniques = pd.factorize(values)
+                np.save(table_dir / f"{i}.codes.npy", codes)
+                np.save(table_dir / f"{i}.values.npy", np.asarray(uniques, dtype=object))
+            else:
+                np.save(table_dir / f"{i}.npy", values.to_numpy())
+
+    return directory
+
+
+def read_snapshot(directory):
+    """Load a snapshot written by ``write_snapshot`` as read-only Tables."""
+    directory = Path(directory)
+
+    frames = []
+    for name in Tables._fields:
+        table_dir = directory / name
+        columns = (table_dir / "columns.txt").read_text().split("\n")
+
+        data = {}
+        for i, column in enumerate(columns):
+            path = table_dir / f"{i}.npy"
+            if path.exists():
+                data[column] = np.load(path, mmap_mode="r")
+            elif (table_dir / f"{i}.cat.npy").exists():
+                # Dictionary-encoded columns stay encoded, codes mapped
+                categories = np.load(table_dir / f"{i}.values.npy", allow_pickle=True)
+                data[column] = pd.Categorical.from_codes(
+                    np.load(table_dir / f"{i}.cat.npy", mmap_mode="r"), categories
+                )
+            else:
+                codes = np.load(table_dir / f"{i}.codes.npy")
+                uniques = np.load(table_dir / f"{i}.values.npy", allow_pickle=True)
+                # factorize marks missing values with -1
+                decoded = np.append(uniques, None).take(codes)
+                data[column] = decoded
+
+        frames.append(pd.DataFrame(data, columns=columns, copy=False))
+
+    return Tables(*frames)
@@ -0,0 +1,136 @@
+import pandas as pd
+
+from .cache import memoize
+from .data import load_data, site_totals
+from .filters import filtered_orders
+
+# ---------------------------------------------------------
+# WEBSITE DASHBOARD
+# ---------------------------------------------------------
+
+STAGE_ORDER = ["Landing Page", "Product Page", "Cart", "Checkout", "Thank You"]
+
+# Pages outside this mapping are not part of the funnel
+STAGE_BY_URL = {
+    "/lander-1": "Landing Page",
+    "/lander-2": "Landing Page",
+    "/lander-3": "Landing Page",
+    "/lander-4": "Landing Page",
+    "/lander-5": "Landing Page",
+    "/home": "Landing Page",
+    "/the-hudson-river-mini-bear": "Product Page",
+    "/the-forever-love-bear": "Product Page",
+    "/the-birthday-sugar-panda": "Product Page",
+    "/the-original-mr-fuzzy": "Product Page",
+    "/products": "Product Page",
+    "/cart": "Cart",
+    "/billing": "Checkout",
+    "/shipping": "Checkout",
+    "/billing-2": "Checkout",
+    "/thank-you-for-your-order": "Thank You",
+}
+
+
+@memoize
+def _pageviews_per_session():
+    return load_data().pageviews.groupby("website_session_id")["pageview_url"].count()
+
+
+@memoize
+def _bounces():
+    return int((_pageviews_per_session() == 1).sum())
+
+
+@memoize
+def website_kpis(filters):
+    """Sessions, pageviews, bounce rate and session conversion rate."""
+    sessions = load_data().website_sessions
+    totals = site_totals()
+
+    total_sessions = totals["total_sessions"]
+    total_pageviews = totals["total_pageviews"]
+
+    converted_ids = filtered_orders(filters)["website_session_id"].unique()
+    converted_sessions = int(sessions["website_session_id"].isin(converted_ids).sum())
+    overall_conversion_rate = converted_sessions / total_sessions if total_sessions > 0 else 0
+
+    overall_bounce_rate = _bounces() / total_sessions if total_sessions > 0 else 0
+
+    return {
+        "total_sessions": total_sessions,
+        "total_pageviews": total_pageviews,
+        "overall_bounce_rate": overall_bounce_rate,
+        "overall_conversion_rate": overall_conversion_rate,
+    }
+
+
+def bounce_by_month(filters):
+    """Share of sessions with exactly one pageview, per session month."""
+    # Does not depend on the filters: computed once
+    return _bounce_by_month()
+
+
+@memoize
+def _bounce_by_month():
+    sessions = load_data().website_sessions
+
+    pageviews_count = (
+        sessions["website_session_id"].map(_pageviews_per_session()).fillna(0)
+    )
+    month = sessions["created_at"].dt.to_period("M").dt.to_timestamp().rename("month")
+
+    return (
+        (pageviews_count == 1).groupby(month)
+        .mean()
+        .reset_index(name="bounce_rate")
+    )
+
+
+@memoize
+def _funnel_stage_sessions():
+    """Distinct (funnel stage, session) pairs over all pageviews."""
+    pageviews = load_data().pageviews
+
+    stage = pageviews["pageview_url"].map(STAGE_BY_URL)
+    in_funnel = stage.notna()
+    return pd.DataFrame({
+        "funnel_stage": stage[in_funnel],
+        "website_session_id": pageviews["website_session_id"][in_funnel],
+    }).drop_duplicates()
+
+
+@memoize
+def funnel(filters):
+    """Sessions and converting sessions reaching each funnel stage."""
+    stage_sessions = _funnel_stage_sessions()
+
+    converted_ids = filtered_orders(filters)["website_session_id"].unique()
+    converted = stage_sessions["website_session_id"].isin(converted_ids)
+
+    funnel_data = (
+        converted.groupby(stage_sessions["funnel_stage"], observed=True)
+        .agg(sessions="size", conversions="sum")
+        .reset_index()
+    )
+    funnel_data["conversion_rate"] = funnel_data["conversions"] / funnel_data["sessions"]
+
+    funnel_data["funnel_stage"] = pd.Categorical(
+        funnel_data["funnel_stage"],
+        categories=STAGE_ORDER,
+        ordered=True
+    )
+    return funnel_data.sort_values("funnel_stage")
+
+
+def sessions_by_device(filters):
+    # Does not depend on the filters: computed once
+    return _sessions_by_device()
+
+
+@memoize
+def _sessions_by_device():
+    return (
+        load_data().website_sessions.groupby("device_type", observed=True)["website_session_id"]
+        .nunique()
+        .reset_index(name="sessions")
+    )
@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import yaml
 import streamlit_authenticator as stauth
 
+import analytics
+from analytics import charts
+
 # ---------------------------------------------------------
 # AUTHENTICATION
 # ---------------------------------------------------------
@@ -118,74 +118,44 @@ elif auth_status:
     # ---------------------------------------------------------
     # Load Data
     # ---------------------------------------------------------
-    @st.cache_data
-    def load_data():
-    
-        # Small CSVs stored in GitHub
-        orders = pd.read_csv("data/orders.csv")
-        order_items = pd.read_csv("data/order_items.csv")
-        products = pd.read_csv("data/products.csv")
-        refunds = pd.read_csv("data/order_item_refunds.csv")
-    
-        # Large CSVs from Hugging Face (direct download)
-        sessions_url = "https://huggingface.co/datasets/Snap-mango01/toy-ecommerce-data/resolve/main/website_sessions_clean.csv?download=1"
-        pageviews_url = "https://huggingface.co/datasets/Snap-mango01/toy-ecommerce-data/resolve/main/website_pageviews.csv?download=1"
-    
-        website_sessions = pd.read_csv(sessions_url)
-        pageviews = pd.read_csv(pageviews_url)
-    
-        return orders, order_items, products, refunds, website_sessions, pageviews
-    
-    
-    # Load all data
-    orders, order_items, products, refunds, website_sessions, pageviews = load_data()
-    
-    # ---------------------------------------------------------
-    # Date Columns Prep
-    # ---------------------------------------------------------
-    orders["created_at"] = pd.to_datetime(orders["created_at"])
-    orders["year"] = orders["created_at"].dt.year
-    orders["month"] = orders["created_at"].dt.month
+    # All loading, filtering and metric logic lives in the analytics package;
+    # this file only renders its (memoised) results.
+    options = analytics.filter_options()
     
     # ---------------------------------------------------------
     # Sidebar Filters
     # ---------------------------------------------------------
     st.sidebar.header("Filters")
     
-    years = ["All"] + sorted(orders["year"].unique().tolist())
-    months = ["All"] + sorted(orders["month"].unique().tolist())
+    selected_year = st.sidebar.selectbox("Select Year", options["years"])
+    selected_month = st.sidebar.selectbox("Select Month", options["months"])
     
-    selected_year = st.sidebar.selectbox("Select Year", years)
-    selected_month = st.sidebar.selectbox("Select Month", months)
+    selected_campaign = st.sidebar.selectbox("Select UTM Campaign", options["utm_campaigns"])
+    selected_source = st.sidebar.selectbox("Select UTM Source", options["utm_sources"])
+    selected_device = st.sidebar.selectbox("Select Device Type", options["device_types"])
     
-    utm_campaigns = ["All"] + sorted(website_sessions["utm_campaign"].dropna().unique().tolist())
-    utm_sources = ["All"] + sorted(website_sessions["utm_source"].dropna().unique().tolist())
-    device_types = ["All"] + sorted(website_sessions["device_type"].dropna().unique().tolist())
-    
-    selected_campaign = st.sidebar.selectbox("Select UTM Campaign", utm_campaigns)
-    selected_source = st.sidebar.selectbox("Select UTM Source", utm_sources)
-    selected_device = st.sidebar.selectbox("Select Device Type", device_types)
+    filters = analytics.Filters(
+        year=selected_year,
+        month=selected_month,
+        campaign=selected_campaign,
+        source=selected_source,
+        device=selected_device,
+    )
     
     # ---------------------------------------------------------
-    # Apply Filters
+    # Alerts
     # ---------------------------------------------------------
-    filtered_orders = orders.copy()
-    filtered_sessions = website_sessions.copy()
+    # Daily anomaly monitor over all data; the sidebar filters do not apply.
+    # Each rerun only processes rows that arrived since the last one.
+    alerts = analytics.refresh_alerts()
     
-    if selected_year != "All":
-        filtered_orders = filtered_orders[filtered_orders["year"] == selected_year]
+    st.sidebar.header("Alerts")
     
-    if selected_month != "All":
-        filtered_orders = filtered_orders[filtered_orders["month"] == selected_month]
-    
-    if selected_campaign != "All":
-        filtered_sessions = filtered_sessions[filtered_sessions["utm_campaign"] == selected_campaign]
-    
-    if selected_source != "All":
-        filtered_sessions = filtered_sessions[filtered_sessions["utm_source"] == selected_source]
-    
-    if selected_device != "All":
-        filtered_sessions = filtered_sessions[filtered_sessions["device_type"] == selected_device]
+    if alerts.empty:
+        st.sidebar.info("No anomalies detected")
+    else:
+        for description in alerts["description"].head(10):
+            st.sidebar.warning(description)
     
     # ---------------------------------------------------------
     # RADIO BUTTONS FOR NAVIGATION
@@ -231,61 +201,24 @@ elif auth_status:
     
         st.subheader("🔑Key Revenue Metrics")
     
-        #  Orders + Order Items
-        order_data = order_items.merge(
-            filtered_orders[["order_id", "created_at", "year", "month"]],
-            on="order_id",
-            how="inner"
-        )
-    
-        order_data = order_data.merge(products[["product_id", "product_name"]], 
-                                      on="product_id", how="left")
-    
         # ---------------------------------------------------------
         # Metrics
         # ---------------------------------------------------------
-        total_revenue = order_data["price_usd"].sum()
-        total_orders = filtered_orders["order_id"].nunique()
-        aov = total_revenue / total_orders if total_orders > 0 else 0
+        kpis = analytics.sales_kpis(filters)
     
         col1, col2, col3 = st.columns(3)
-        col1.metric("Total Revenue", f"${total_revenue:,.2f}")
-        col2.metric("Total Orders", total_orders)
-        col3.metric("Avg Order Value", f"${aov:,.2f}")
+        col1.metric("Total Revenue", f"${kpis['total_revenue']:,.2f}")
+        col2.metric("Total Orders", kpis["total_orders"])
+        col3.metric("Avg Order Value", f"${kpis['aov']:,.2f}")
     
         # ---------------------------------------------------------
         # Revenue by Year 
         # ---------------------------------------------------------
         st.subheader("Revenue by Year")
     
-        yearly_rev = (
-            order_data.groupby("year")["price_usd"]
-            .sum()
-            .reset_index()
-        )
-    
-        # Make sure the year is an integer
-        yearly_rev["year"] = yearly_rev["year"].astype(int)
-    
         # Visual
-        fig_year = px.line(
-            yearly_rev,
-            x="year",
-            y="price_usd",
-            markers=True,
-            title="Revenue by Year",
-        )
-    
-        # Update the layout and x-axis formatting
-        fig_year.update_layout(
-            xaxis=dict(
-                tickmode="linear",  
-                tickformat="%Y"     
-            ),
-            height=350
-        )
+        fig_year = charts.revenue_by_year(analytics.revenue_by_year(filters))
     
-        
         st.plotly_chart(fig_year, use_container_width=True)
     
     
@@ -294,21 +227,7 @@ elif auth_status:
         # ---------------------------------------------------------
         st.subheader("🧸Revenue by Product")
     
-        product_rev = (
-            order_data.groupby("product_name")["price_usd"]
-            .sum()
-            .reset_index()
-            .sort_values("price_usd", ascending=False)
-        )
-    
-        fig_pie = px.pie(
-            product_rev,
-            names="product_name",
-            values="price_usd",
-            title="Revenue Share by Product",
-        )
-        fig_pie.update_traces(textposition="inside", textinfo="percent+label")
-        fig_pie.update_layout(height=400)
+        fig_pie = charts.revenue_by_product(analytics.revenue_by_product(filters))
     
         st.plotly_chart(fig_pie, use_container_width=True)
     
@@ -317,38 +236,7 @@ elif auth_status:
         # ---------------------------------------------------------
         st.subheader("Revenue by Campaign")
     
-        order_data2 = order_items.merge(
-            filtered_orders[
-                ["order_id", "created_at", "year", "month", "website_session_id"]
-            ],
-            on="order_id",
-            how="inner"
-        )
-    
-        rev_with_sessions = order_data2.merge(
-            website_sessions[["website_session_id", "utm_campaign", "utm_source"]],
-            on="website_session_id",
-            how="left"
-        )
-    
-        campaign_rev = (
-            rev_with_sessions.groupby("utm_campaign")["price_usd"]
-            .sum()
-            .reset_index()
-            .sort_values("price_usd", ascending=False)
-        )
-    
-        fig_campaign = px.bar(
-            campaign_rev,
-            x="utm_campaign",
-            y="price_usd",
-            title="Revenue by Campaign",
-            text_auto=True
-        )
-    
-        fig_campaign.update_traces(texttemplate="%{y:.2s}", textposition="outside", cliponaxis=False)
-    
-        fig_campaign.update_layout(xaxis_tickangle=45, height=350, margin=dict(t=80))
+        fig_campaign = charts.revenue_by_campaign(analytics.revenue_by_campaign(filters))
     
         st.plotly_chart(fig_campaign, use_container_width=True)
     
@@ -357,26 +245,18 @@ elif auth_status:
         # ---------------------------------------------------------
         st.subheader("Revenue by UTM Source")
     
-        source_rev = (
-            rev_with_sessions.groupby("utm_source")["price_usd"]
-            .sum()
-            .reset_index()
-            .sort_values("price_usd", ascending=False)
-        )
+        fig_source = charts.revenue_by_source(analytics.revenue_by_source(filters))
     
-        fig_source = px.bar(
-            source_rev,
-            x="utm_source",
-            y="price_usd",
-            title="Revenue by Traffic Source",
-            text_auto=True
-        )
+        st.plotly_chart(fig_source, use_container_width=True)
     
-        fig_source.update_traces(texttemplate="%{y:.2s}", textposition="outside", cliponaxis=False)
+        # ---------------------------------------------------------
+        # DAILY REVENUE MONITOR
+        # ---------------------------------------------------------
+        st.subheader("Daily Revenue Monitor")
     
-        fig_source.update_layout(xaxis_tickangle=45, height=350, margin=dict(t=80))
+        fig_revenue_monitor = charts.daily_monitor(analytics.daily_series("revenue"), analytics.METRICS["revenue"])
     
-        st.plotly_chart(fig_source, use_container_width=True)
+        st.plotly_chart(fig_revenue_monitor, use_container_width=True)
     
     
     # --------------------------------------------------------- 
@@ -388,39 +268,7 @@ elif auth_status:
     
         st.subheader("🔑Key Product Metrics")
     
-        # orders + products
-        prod_data = order_items.merge(
-            filtered_orders[["order_id", "created_at", "year", "month", "website_session_id"]],
-            on="order_id",
-            how="inner"
-        )
-    
-        prod_data = prod_data.merge(products[["product_id", "product_name"]], 
-                                    on="product_id", how="left")
-    
-        # Refunds
-        order_item_refunds = pd.read_csv("data/order_item_refunds.csv")
-    
-        refunds_merged = prod_data.merge(
-            order_item_refunds,
-            on="order_item_id",
-            how="left"
-        )
-    
-        # Use correct refund column
-        refunds_merged["refund_amount_usd"] = refunds_merged["refund_amount_usd"].fillna(0)
-    
-        # KPIs
-        total_products = products["product_id"].nunique()
-        total_units_sold = prod_data.shape[0]
-        refunded_units = refunds_merged[refunds_merged["refund_amount_usd"] > 0].shape[0]
-        refund_rate = refunded_units / total_units_sold if total_units_sold > 0 else 0
-    
-        top_product = prod_data["product_name"].value_counts().idxmax()
-        
-        total_refund_amount = refunds_merged["refund_amount_usd"].sum()
-        total_revenue_products = prod_data["price_usd"].sum()
-        pct_revenue_lost = total_refund_amount / total_revenue_products if total_revenue_products > 0 else 0
+        kpis = analytics.product_kpis(filters)
     
         # KPIs
         col1, col2, col3, col4 = st.columns(4)
@@ -430,53 +278,41 @@ elif auth_status:
             st.markdown(
                 f"""
                 <div style="font-size: 24px; font-weight: 600; line-height: 1.1;">
-                    {top_product}
+                    {kpis['top_product'] or '-'}
                 </div>
                 """,
                 unsafe_allow_html=True
             )
     
         with col2:
-            st.metric("Total Products", total_products)
+            st.metric("Total Products", kpis["total_products"])
     
         with col3:
-            st.metric("Total Units Sold", f"{total_units_sold:,}")
+            st.metric("Total Units Sold", f"{kpis['total_units_sold']:,}")
     
         with col4:
-            st.metric("Refund Rate", f"{refund_rate*100:.2f}%")
+            st.metric("Refund Rate", f"{kpis['refund_rate']*100:.2f}%")
     
         col5, col6 = st.columns(2)
     
         with col5:
-            st.metric("Total Refund Amount", f"${total_refund_amount:,.2f}")
+            st.metric("Total Refund Amount", f"${kpis['total_refund_amount']:,.2f}")
     
         with col6:
-            st.metric("% Revenue Lost to Refunds", f"{pct_revenue_lost*100:.2f}%")
+            st.metric("% Revenue Lost to Refunds", f"{kpis['pct_revenue_lost']*100:.2f}%")
     
     
         # Revenue Over Time
         st.subheader("Revenue Over Time — by Product")
     
-        revenue_over_time = (
-            prod_data.groupby(["year", "month", "product_name"])["price_usd"]
-            .sum()
-            .reset_index()
-        )
-    
-        revenue_over_time["date"] = pd.to_datetime(
-            revenue_over_time["year"].astype(str) + "-" + 
-            revenue_over_time["month"].astype(str) + "-01"
-        )
+        rev_over_time = analytics.revenue_over_time_by_product(filters)
+        fig_rev_product = charts.revenue_over_time_by_product(rev_over_time)
     
-        fig_rev_product = px.line(
-            revenue_over_time,
-            x="date",
-            y="price_usd",
-            color="product_name",
-            markers=True,
-            title="Revenue Over Time by Product"
+        # Mark months with daily revenue alerts
+        charts.add_alert_markers(
+            fig_rev_product, rev_over_time, "date", "price_usd",
+            alerts[alerts["metric"] == "revenue"]
         )
-        fig_rev_product.update_layout(height=400)
     
         st.plotly_chart(fig_rev_product, use_container_width=True)
     
@@ -486,37 +322,18 @@ elif auth_status:
     
         st.subheader("Conversion Rate by Product")
     
-        # Total sessions (filtered by year/month if applied)
-        total_sessions = website_sessions["website_session_id"].nunique()
+        fig_conv_product = charts.conversion_by_product(analytics.conversion_by_product(filters))
     
-        # Orders per product
-        orders_per_product = (
-            prod_data.groupby("product_name")["order_id"]
-            .nunique()
-            .reset_index()
-            .rename(columns={"order_id": "orders"})
-        )
+        st.plotly_chart(fig_conv_product, use_container_width=True)
     
-        orders_per_product["sessions"] = total_sessions
-        orders_per_product["conversion_rate"] = (
-            orders_per_product["orders"] / total_sessions
-        )
+        # ---------------------------------------------------------
+        # DAILY REFUNDS PER ITEM SOLD MONITOR
+        # ---------------------------------------------------------
+        st.subheader("Daily Refunds Issued per Item Sold Monitor")
     
-        fig_conv_product = px.bar(
-            orders_per_product,
-            x="product_name",
-            y="conversion_rate",
-            title="Conversion Rate by Product",
-            text=orders_per_product["conversion_rate"].apply(lambda x: f"{x*100:.2f}%")
-        )
+        fig_refund_monitor = charts.daily_monitor(analytics.daily_series("refunds_per_item_sold"), analytics.METRICS["refunds_per_item_sold"])
     
-        fig_conv_product.update_layout(
-            xaxis_tickangle=45,
-            height=400,
-            yaxis_title="Conversion Rate"
-        )
-    
-        st.plotly_chart(fig_conv_product, use_container_width=True)
+        st.plotly_chart(fig_refund_monitor, use_container_width=True)
     
     
     
@@ -530,83 +347,43 @@ elif auth_status:
         # ------------------ KPI CARDS ------------------
         st.subheader("🔑Key Marketing Metrics")
     
-        # Unique Users
-        unique_users = website_sessions["user_id"].nunique()
-    
-        # Total Site Traffic (sessions)
-        total_traffic = website_sessions["website_session_id"].nunique()
-    
-        #Customer Conversion rate (Customers who purchased/unique users)
-        # Unique users who visited the site
-        unique_users = website_sessions["user_id"].nunique()
-    
-        # Unique customers who purchased (from orders)
-        unique_purchasers = filtered_orders["user_id"].nunique()
-    
-        # Customer Conversion Rate
-        customer_conversion_rate = unique_purchasers / unique_users if unique_users > 0 else 0
-    
-            # Repeat User Rate
-        user_order_counts = filtered_orders.groupby("user_id")["order_id"].nunique()
-        repeat_user_rate = (user_order_counts > 1).mean()
+        kpis = analytics.marketing_kpis(filters)
     
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Unique Users", f"{unique_users:,}")
-        col2.metric("Total Site Traffic", f"{total_traffic:,}")
-        col3.metric("Customer Conversion Rate", f"{customer_conversion_rate*100:.2f}%")
-        col4.metric("Repeat User Rate", f"{repeat_user_rate*100:.2f}%")
+        col1.metric("Unique Users", f"{kpis['unique_users']:,}")
+        col2.metric("Total Site Traffic", f"{kpis['total_traffic']:,}")
+        col3.metric("Customer Conversion Rate", f"{kpis['customer_conversion_rate']*100:.2f}%")
+        col4.metric("Repeat User Rate", f"{kpis['repeat_user_rate']*100:.2f}%")
     
         # ------------------ Website Sessions by UTM Source ------------------
         st.subheader("Website Sessions by UTM Source")
     
-        utm_source_counts = (
-            website_sessions.groupby("utm_source")["website_session_id"]
-            .nunique()
-            .reset_index(name="sessions")
-            .sort_values("sessions", ascending=False)
-        )
+        fig_utm_pie = charts.sessions_by_source(analytics.sessions_by_source(filters))
     
-        fig_utm_pie = px.pie(
-            utm_source_counts,
-            names="utm_source",
-            values="sessions",
-            title="Website Sessions by UTM Source"
-        )
-        fig_utm_pie.update_traces(textposition="inside", textinfo="percent+label")
         st.plotly_chart(fig_utm_pie, use_container_width=True)
     
         # ------------------ Conversion Rate Over Time ------------------
         st.subheader("Monthly Conversion Rate Over Time")
     
+        conv_over_time = analytics.conversion_by_month(filters)
+        fig_conv_time = charts.conversion_by_month(conv_over_time)
     
-        filtered_orders['created_at'] = pd.to_datetime(filtered_orders['created_at'])
+        # Mark months with daily conversion rate alerts
+        charts.add_alert_markers(
+            fig_conv_time, conv_over_time, "month", "conversion_rate",
+            alerts[alerts["metric"] == "conversion_rate"]
+        )
     
-        # Total sessions per month
-        sessions_per_month = website_sessions.copy()
-        
-        sessions_per_month['month'] = pd.to_datetime(sessions_per_month['created_at']).dt.to_period('M').dt.to_timestamp()
-        sessions_per_month = sessions_per_month.groupby('month')['website_session_id'].nunique().reset_index(name='sessions')
+        st.plotly_chart(fig_conv_time, use_container_width=True)
     
-        # Total orders per month
-        orders_per_month = filtered_orders.copy()
-        orders_per_month['month'] = orders_per_month['created_at'].dt.to_period('M').dt.to_timestamp()
-        orders_per_month = orders_per_month.groupby('month')['order_id'].nunique().reset_index(name='orders')
+        # ---------------------------------------------------------
+        # DAILY CONVERSION RATE MONITOR
+        # ---------------------------------------------------------
+        st.subheader("Daily Conversion Rate Monitor")
     
-        # Merging sessions and orders
-        conv_over_time = sessions_per_month.merge(orders_per_month, on='month', how='left')
-        conv_over_time['orders'] = conv_over_time['orders'].fillna(0)
-        conv_over_time['conversion_rate'] = conv_over_time['orders'] / conv_over_time['sessions']
+        fig_conversion_monitor = charts.daily_monitor(analytics.daily_series("conversion_rate"), analytics.METRICS["conversion_rate"])
     
-        
-        fig_conv_time = px.line(
-            conv_over_time,
-            x='month',
-            y='conversion_rate',
-            markers=True,
-            title="Monthly Conversion Rate Over Time"
-        )
-        fig_conv_time.update_layout(yaxis_title="Conversion Rate", height=400)
-        st.plotly_chart(fig_conv_time, use_container_width=True)
+        st.plotly_chart(fig_conversion_monitor, use_container_width=True)
     
     elif tab == "💻 Website Analytics":
     
@@ -615,76 +392,18 @@ elif auth_status:
         # ------------------ KPI CARDS ------------------
         st.subheader("🔑Key Website Metrics")
     
-        # Ensuring datetime
-        website_sessions['created_at'] = pd.to_datetime(website_sessions['created_at'])
-        pageviews['created_at'] = pd.to_datetime(pageviews['created_at'])
-    
-        # Converted flag from filtered_orders
-        converted_sessions_df = filtered_orders[['website_session_id']].drop_duplicates()
-        converted_sessions_df['converted'] = 1
-    
-        website_sessions = website_sessions.merge(
-            converted_sessions_df,
-            on='website_session_id',
-            how='left'
-        )
-        website_sessions['converted'] = website_sessions['converted'].fillna(0).astype(int)
-    
-        # ------------------ KPI Cards ------------------
-        total_sessions = website_sessions['website_session_id'].nunique()
-        total_pageviews = pageviews.shape[0]
-    
-        # Session conversion rate
-        converted_sessions = website_sessions['converted'].sum()
-        overall_conversion_rate = converted_sessions / total_sessions if total_sessions > 0 else 0
-    
-        # Bounce Rate
-        pageviews_per_session = (
-            pageviews.groupby('website_session_id')['pageview_url']
-            .count()
-            .reset_index(name='pageviews_count')
-        )
-    
-        bounces = pageviews_per_session[pageviews_per_session['pageviews_count'] == 1].shape[0]
-        overall_bounce_rate = bounces / total_sessions if total_sessions > 0 else 0
+        kpis = analytics.website_kpis(filters)
     
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Sessions", f"{total_sessions:,}")
-        col2.metric("Total Pageviews", f"{total_pageviews:,}")
-        col3.metric("Overall Bounce Rate", f"{overall_bounce_rate*100:.2f}%")
-        col4.metric("Session Conversion Rate", f"{overall_conversion_rate*100:.2f}%")
+        col1.metric("Total Sessions", f"{kpis['total_sessions']:,}")
+        col2.metric("Total Pageviews", f"{kpis['total_pageviews']:,}")
+        col3.metric("Overall Bounce Rate", f"{kpis['overall_bounce_rate']*100:.2f}%")
+        col4.metric("Session Conversion Rate", f"{kpis['overall_conversion_rate']*100:.2f}%")
     
         # ------------------ Bounce Rate Over Time ------------------
         st.subheader("Bounce Rate Over Time")
     
-        sessions_with_pages = website_sessions.merge(
-            pageviews_per_session,
-            on='website_session_id',
-            how='left'
-        )
-    
-        sessions_with_pages['pageviews_count'] = sessions_with_pages['pageviews_count'].fillna(0)
-        sessions_with_pages['month'] = sessions_with_pages['created_at'].dt.to_period('M').dt.to_timestamp()
-    
-    
-        monthly_bounce = (
-            sessions_with_pages.groupby('month')
-            .apply(lambda x: (x['pageviews_count'] == 1).mean())
-            .reset_index(name='bounce_rate')
-        )
-    
-        fig_bounce = px.line(
-            monthly_bounce,
-            x='month',
-            y='bounce_rate',
-            markers=True,
-            title="Monthly Bounce Rate Over Time"
-        )
-    
-        fig_bounce.update_layout(
-            yaxis_title="Bounce Rate",
-            height=400
-        )
+        fig_bounce = charts.bounce_by_month(analytics.bounce_by_month(filters))
     
         st.plotly_chart(fig_bounce, use_container_width=True)
     
@@ -693,119 +412,64 @@ elif auth_status:
         # ---------------------------------------------------------
         st.header("Conversion Funnel by Page Group")
     
-        # Mapping function for funnel stages
-        def map_page_to_stage(page_url):
-            if page_url in ["/lander-1", "/lander-2", "/lander-3", "/lander-4", "/lander-5", "/home"]:
-                return "Landing Page"
-            elif page_url in [
-                "/the-hudson-river-mini-bear",
-                "/the-forever-love-bear",
-                "/the-birthday-sugar-panda",
-                "/the-original-mr-fuzzy",
-                "/products"
-            ]:
-                return "Product Page"
-            elif page_url == "/cart":
-                return "Cart"
-            elif page_url in ["/billing", "/shipping", "/billing-2"]:
-                return "Checkout"
-            elif page_url == "/thank-you-for-your-order":
-                return "Thank You"
-            else:
-                return None   # This replaces "Other" completely
-    
-        # Tag pageviews with funnel stage
-        pageviews["funnel_stage"] = pageviews["pageview_url"].apply(map_page_to_stage)
-    
-        # Remove rows that are not part of the funnel
-        pageviews = pageviews[pageviews["funnel_stage"].notna()]
-    
-        # -------------------------------
-        # COUNT UNIQUE SESSIONS PER STAGE
-        # -------------------------------
-        sessions_per_stage = (
-            pageviews.groupby("funnel_stage")["website_session_id"]
-            .nunique()
-            .reset_index(name="sessions")
-        )
+        fig = charts.funnel(analytics.funnel(filters))
     
-        # -------------------------------
-        # CONVERTED SESSIONS
-        # -------------------------------
-        session_conversions = (
-            filtered_orders.groupby("website_session_id")["order_id"]
-            .nunique()
-            .reset_index()
-        )
-        session_conversions["converted"] = session_conversions["order_id"] > 0
-        session_conversions = session_conversions[["website_session_id", "converted"]]
-    
-        # Attach conversion status to each pageview
-        pv = pageviews.merge(session_conversions, on="website_session_id", how="left")
-        pv["converted"] = pv["converted"].fillna(False)
-    
-        # Count unique converting sessions per stage
-        conversions_per_stage = (
-            pv[pv["converted"]]
-            .groupby("funnel_stage")["website_session_id"]
-            .nunique()
-            .reset_index(name="conversions")
-        )
+        st.plotly_chart(fig, use_container_width=True)
     
-        # Merge sessions + conversions
-        funnel_data = sessions_per_stage.merge(conversions_per_stage, on="funnel_stage", how="left")
-        funnel_data["conversions"] = funnel_data["conversions"].fillna(0)
     
-        # Conversion rate
-        funnel_data["conversion_rate"] = funnel_data["conversions"] / funnel_data["sessions"]
+        # ------------------ Device-based Sessions ------------------
+        st.subheader("Device-based Website Sessions")
     
-        # -------------------------------
-        # ORDER STAGES
-        # -------------------------------
-        stage_order = ["Landing Page", "Product Page", "Cart", "Checkout", "Thank You"]
+        fig_device = charts.sessions_by_device(analytics.sessions_by_device(filters))
     
-        funnel_data["funnel_stage"] = pd.Categorical(
-            funnel_data["funnel_stage"],
-            categories=stage_order,
-            ordered=True
-        )
-        funnel_data = funnel_data.sort_values("funnel_stage")
-    
-        # -------------------------------
-        # PLOT FUNNEL
-        # -------------------------------
-        fig = px.funnel(
-            funnel_data,
-            x="sessions",
-            y="funnel_stage",
-            title="Conversion Funnel by WebPage",
-            text=funnel_data["conversion_rate"].apply(lambda x: f"{x:.1%}"),
-            labels={"sessions": "Sessions", "funnel_stage": "Funnel Stage"}
-        )
+        st.plotly_chart(fig_device, use_container_width=True)
     
-        st.plotly_chart(fig, use_container_width=True)
+        # ---------------------------------------------------------
+        # DAILY SESSIONS MONITOR
+        # ---------------------------------------------------------
+        st.subheader("Daily Sessions Monitor")
     
+        fig_sessions_monitor = charts.daily_monitor(analytics.daily_series("sessions"), analytics.METRICS["sessions"])
     
-        # ------------------ Device-based Sessions ------------------
-        st.subheader("Device-based Website Sessions")
+        st.plotly_chart(fig_sessions_monitor, use_container_width=True)
     
-        device_data = (
-            website_sessions.groupby('device_type')['website_session_id']
-            .nunique()
-            .reset_index(name='sessions')
-        )
+        # ---------------------------------------------------------
+        # TIME ON SITE & PAGE PATHS
+        # ---------------------------------------------------------
+        st.header("Time on Site & Page Paths")
     
-        fig_device = px.pie(
-            device_data,
-            names='device_type',
-            values='sessions',
-            title="Sessions by Device Type"
-        )
+        kpis = analytics.time_on_site_kpis(filters)
+    
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Avg Session Duration", f"{kpis['avg_session_seconds']/60:.1f} min")
+        col2.metric("Median Multi-page Session", f"{kpis['median_multi_page_session_seconds']/60:.1f} min")
+        col3.metric("Avg Pages per Session", f"{kpis['avg_pages_per_session']:.2f}")
+        col4.metric("Avg Time Between Pages", f"{kpis['avg_seconds_between_pages']:.0f} s")
     
-        fig_device.update_traces(textposition='inside', textinfo='percent+label')
-        fig_device.update_layout(height=400)
+        fig_length = charts.session_length_distribution(analytics.session_length_distribution(filters))
     
-        st.plotly_chart(fig_device, use_container_width=True)
+        st.plotly_chart(fig_length, use_container_width=True)
+    
+        fig_paths = charts.page_transitions(analytics.page_transitions(filters))
+    
+        st.plotly_chart(fig_paths, use_container_width=True)
+    
+    # ---------------------------------------------------------
+    # BACKGROUND PREFETCH
+    # ---------------------------------------------------------
+    # Once this tab has rendered, warm the other tabs for this selection
+    # (then its neighbouring months/years) while the user reads it. Started
+    # last so it never competes with the render above.
+    TAB_QUERY_KEYS = {
+        "📊 Sales Dashboard": "sales",
+        "🧸 Product Performance": "products",
+        "📣 Marketing Insights": "marketing",
+        "💻 Website Analytics": "website",
+    }
+    
+    if "prefetcher" not in st.session_state:
+        st.session_state["prefetcher"] = analytics.Prefetcher()
+    st.session_state["prefetcher"].warm(filters, options, skip_tab=TAB_QUERY_KEYS.get(tab))
     
 
 
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import Tables, set_tables
+
+URLS = ["/home", "/products", "/the-original-mr-fuzzy", "/cart", "/shipping", "/billing",
+        "/thank-you-for-your-order"]
+
+
+def make_tables(days=90, sessions_per_day=20, seed=0):
+    """Small synthetic tables shaped like the loaded CSVs."""
+    rng = np.random.default_rng(seed)
+
+    n_sessions = days * sessions_per_day
+    session_ids = np.arange(1, n_sessions + 1)
+    session_starts = (
+        pd.Timestamp("2014-01-01")
+        + pd.to_timedelta(np.repeat(np.arange(days), sessions_per_day), unit="D")
+        + pd.to_timedelta(rng.integers(0, 20 * 3600, n_sessions), unit="s")
+    )
+    website_sessions = pd.DataFrame({
+        "website_session_id": session_ids,
+        "created_at": session_starts,
+        "user_id": rng.integers(1, n_sessions // 2, n_sessions),
+        "utm_source": pd.Categorical(rng.choice(["bsearch", "gsearch"], n_sessions)),
+        "utm_campaign": pd.Categorical(rng.choice(["brand", "nonbrand"], n_sessions)),
+        "device_type": pd.Categorical(rng.choice(["desktop", "mobile"], n_sessions)),
+    })
+
+    # 1-4 pageviews per session, one minute apart
+    views = rng.integers(1, 5, n_sessions)
+    view_session = np.repeat(session_ids, views)
+    view_step = np.concatenate([np.arange(k) for k in views])
+    pageviews = pd.DataFrame({
+        "website_pageview_id": np.arange(1, len(view_session) + 1),
+        "created_at": np.repeat(session_starts, views) + pd.to_timedelta(view_step, unit="min"),
+        "website_session_id": view_session,
+        "pageview_url": pd.Categorical(np.array(URLS)[np.minimum(view_step, len(URLS) - 1)]),
+    })
+
+    # A quarter of the sessions order one item
+    ordering = session_ids[rng.random(n_sessions) < 0.25]
+    order_ids = np.arange(1, len(ordering) + 1)
+    order_times = session_starts[ordering - 1] + pd.Timedelta(minutes=30)
+    prices = rng.choice([49.99, 29.99], len(ordering))
+    orders = pd.DataFrame({
+        "order_id": order_ids,
+        "created_at": order_times,
+        "website_session_id": ordering,
+        "user_id": website_sessions["user_id"].to_numpy()[ordering - 1],
+        "price_usd": prices,
+    })
+    orders["year"] = orders["created_at"].dt.year
+    orders["month"] = orders["created_at"].dt.month
+
+    order_items = pd.DataFrame({
+        "order_item_id": order_ids,
+        "created_at": order_times.astype(str),
+        "order_id": order_ids,
+        "product_id": np.where(prices > 40, 1, 2),
+        "price_usd": prices,
+    })
+    products = pd.DataFrame({
+        "product_id": [1, 2],
+        "created_at": ["2012-03-19 08:00:00", "2013-01-06 13:00:00"],
+        "product_name": ["The Original Mr. Fuzzy", "The Forever Love Bear"],
+    })
+
+    # Some items are refunded a few days after the sale
+    refunded = order_ids[rng.random(len(order_ids)) < 0.05]
+    refunds = pd.DataFrame({
+        "order_item_refund_id": np.arange(1, len(refunded) + 1),
+        "created_at": (order_times[refunded - 1] + pd.Timedelta(days=3)).astype(str),
+        "order_item_id": refunded,
+        "order_id": refunded,
+        "refund_amount_usd": prices[refunded - 1],
+    })
+
+    return Tables(orders, order_items, products, refunds, website_sessions, pageviews)
+
+
+@pytest.fixture
+def tables():
+    tables = make_tables()
+    set_tables(tables)
+    yield tables
+    set_tables(None)
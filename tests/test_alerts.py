@@ -0,0 +1,75 @@
+import pandas as pd
+
+import analytics
+from analytics import METRICS, Tables
+from analytics.alerts import AlertMonitor
+
+from conftest import make_tables
+
+
+def cut(tables, until):
+    """Rows created before ``until``, as if the rest had not arrived yet."""
+    return Tables(*[
+        frame[pd.to_datetime(frame["created_at"]) < until] if "created_at" in frame else frame
+        for frame in tables
+    ])
+
+
+def test_incremental_refreshes_match_a_full_pass(tables):
+    incremental = AlertMonitor()
+    for until in ("2014-01-20", "2014-02-03", "2014-02-04", "2014-03-15"):
+        incremental.refresh(cut(tables, pd.Timestamp(until)))
+    incremental.refresh(tables)
+
+    full = AlertMonitor()
+    full.refresh(tables)
+
+    expected = full.daily_series()
+    assert set(expected["metric"]) == set(METRICS)
+    pd.testing.assert_frame_equal(incremental.daily_series(), expected)
+    pd.testing.assert_frame_equal(incremental.alerts(), full.alerts())
+
+
+def test_refresh_without_new_rows_reuses_results(tables):
+    monitor = AlertMonitor()
+    monitor.refresh(tables)
+    series, alerts = monitor.daily_series("revenue"), monitor.alerts()
+
+    monitor.refresh(tables)
+    assert monitor.daily_series("revenue") is series
+    assert monitor.alerts() is alerts
+
+
+def test_spike_is_flagged(tables):
+    orders = tables.orders
+    spike_day = orders["created_at"].dt.normalize() == pd.Timestamp("2014-03-10")
+    spiked = tables._replace(orders=orders.assign(price_usd=orders["price_usd"].where(~spike_day, 10_000)))
+
+    monitor = AlertMonitor()
+    monitor.refresh(spiked)
+
+    flagged = monitor.alerts()
+    assert ((flagged["metric"] == "revenue") & (flagged["date"] == "2014-03-10")).any()
+
+
+def test_no_scored_days_yet(tables):
+    monitor = AlertMonitor()
+    monitor.refresh(make_tables(days=1))
+
+    assert monitor.daily_series("revenue").empty
+    alerts = monitor.alerts()
+    assert alerts.empty
+    assert "description" in alerts
+    assert alerts["date"].dtype.kind == "M"
+
+
+def test_set_tables_resets_the_shared_monitor(tables):
+    analytics.set_tables(make_tables(days=60))
+    analytics.refresh_alerts()
+
+    longer = make_tables(days=90)
+    analytics.set_tables(longer)
+
+    fresh = AlertMonitor()
+    fresh.refresh(longer)
+    pd.testing.assert_frame_equal(analytics.daily_series(), fresh.daily_series())
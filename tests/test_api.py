@@ -0,0 +1,44 @@
+import asyncio
+
+from analytics.api import app, etag_matches
+
+
+def request(path, query_string=b"", headers=()):
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": path,
+             "query_string": query_string, "headers": list(headers)}
+    asyncio.run(app(scope, None, send))
+    return sent[0]["status"], dict(sent[0]["headers"]), sent[1]["body"]
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc" , "y"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches("", '"abc"')
+    assert not etag_matches('"abcd", "ab"', '"abc"')
+
+
+def test_conditional_request_gets_304(tables):
+    status, headers, body = request("/queries/funnel", b"year=2014&month=2")
+    assert status == 200 and body
+
+    etag = headers[b"etag"]
+    for if_none_match in (etag, b"W/" + etag, b'"other", ' + etag, b"*"):
+        status, _, body = request("/queries/funnel", b"year=2014&month=2",
+                                  [(b"if-none-match", if_none_match)])
+        assert (status, body) == (304, b"")
+
+    status, _, _ = request("/queries/funnel", b"year=2014&month=3", [(b"if-none-match", etag)])
+    assert status == 200
+
+
+def test_bad_filter_is_400(tables):
+    assert request("/queries/sales_kpis", b"year=x")[0] == 400
+    assert request("/queries/sales_kpis", b"yr=2014")[0] == 400
+    assert request("/queries/nope")[0] == 404
@@ -0,0 +1,41 @@
+import threading
+import time
+
+from analytics.cache import memoize
+
+
+def test_concurrent_calls_share_one_computation():
+    calls = []
+
+    @memoize
+    def slow(key):
+        calls.append(key)
+        time.sleep(0.1)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow("a"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["a"]
+    assert len({id(result) for result in results}) == 1
+
+
+def test_errors_reach_waiting_callers_and_are_not_cached():
+    attempts = []
+
+    @memoize
+    def failing(key):
+        attempts.append(key)
+        raise ValueError(key)
+
+    for _ in range(2):
+        try:
+            failing("a")
+        except ValueError:
+            pass
+
+    assert attempts == ["a", "a"]
@@ -0,0 +1,72 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+import analytics
+from analytics import ENCODED_COLUMNS, Filters, data
+
+from conftest import make_tables
+
+
+@pytest.fixture
+def csv_tables(tmp_path, monkeypatch):
+    """Synthetic tables written as the app's CSVs (unsorted values, some missing) and read back."""
+    tables = make_tables()
+    sessions = tables.website_sessions.astype({column: object for column in ENCODED_COLUMNS["website_sessions"]})
+    sessions.loc[::7, "utm_source"] = np.nan
+    sessions.loc[::11, "utm_campaign"] = "zz-social"
+
+    for name, frame in (("orders", tables.orders.drop(columns=["year", "month"])),
+                        ("order_items", tables.order_items),
+                        ("products", tables.products),
+                        ("order_item_refunds", tables.refunds)):
+        frame.to_csv(tmp_path / f"{name}.csv", index=False)
+    sessions.iloc[::-1].to_csv(tmp_path / "website_sessions.csv", index=False)
+    tables.pageviews.to_csv(tmp_path / "website_pageviews.csv", index=False)
+
+    monkeypatch.setattr(data, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(data, "SESSIONS_URL", tmp_path / "website_sessions.csv")
+    monkeypatch.setattr(data, "PAGEVIEWS_URL", tmp_path / "website_pageviews.csv")
+
+    encoded = data.read_tables()
+    analytics.set_tables(encoded)
+    yield encoded
+    analytics.set_tables(None)
+
+
+def test_encoded_columns_hold_small_integer_codes(csv_tables):
+    for table, columns in ENCODED_COLUMNS.items():
+        for column in columns:
+            codes = getattr(csv_tables, table)[column].cat.codes
+            assert codes.dtype in (np.int8, np.int16)
+
+
+def test_filter_options_come_from_the_dictionaries(csv_tables):
+    sessions = csv_tables.website_sessions.astype(object)
+    options = analytics.filter_options()
+    dictionaries = analytics.dictionaries()
+
+    for option, column in (("utm_campaigns", "utm_campaign"),
+                           ("utm_sources", "utm_source"),
+                           ("device_types", "device_type")):
+        expected = sorted(sessions[column].dropna().unique().tolist())
+        assert options[option] == ["All"] + expected
+        assert dictionaries[column].tolist() == expected
+
+
+def test_filtering_on_codes_matches_filtering_on_strings(csv_tables):
+    sessions = csv_tables.website_sessions
+    strings = sessions.astype({column: object for column in ENCODED_COLUMNS["website_sessions"]})
+    options = analytics.filter_options()
+
+    for campaign, source, device in product(
+        options["utm_campaigns"] + ["nope"], options["utm_sources"], options["device_types"]
+    ):
+        mask = np.ones(len(strings), dtype=bool)
+        for column, value in (("utm_campaign", campaign), ("utm_source", source), ("device_type", device)):
+            if value != "All":
+                mask &= (strings[column] == value).to_numpy()
+
+        selected = analytics.filtered_sessions(Filters(campaign=campaign, source=source, device=device))
+        assert selected["website_session_id"].tolist() == strings.loc[mask, "website_session_id"].tolist()
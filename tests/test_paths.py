@@ -0,0 +1,31 @@
+import analytics
+from analytics import Filters
+
+
+def test_session_durations_match_groupby(tables):
+    pageviews = tables.pageviews
+    grouped = pageviews.groupby("website_session_id")["created_at"]
+    expected = (grouped.max() - grouped.min()).dt.total_seconds()
+
+    durations = analytics.session_durations(Filters()).set_index("website_session_id")
+
+    assert len(durations) == len(expected)
+    assert (durations["duration_seconds"] == expected.reindex(durations.index)).all()
+    assert (durations["pageviews"] == grouped.size().reindex(durations.index)).all()
+
+
+def test_page_transitions_count_consecutive_views(tables):
+    transitions = analytics.page_transitions(Filters())
+
+    # Every session with k views contributes k - 1 transitions
+    sizes = tables.pageviews.groupby("website_session_id").size()
+    assert transitions["transitions"].sum() == (sizes - 1).sum()
+    assert (transitions["mean_seconds"] == 60).all()
+
+
+def test_empty_selection(tables):
+    for filters in (Filters(campaign="nope"), Filters(year=2015, month=12)):
+        assert analytics.session_durations(filters).empty
+        assert analytics.page_transitions(filters).empty
+        assert analytics.time_on_site_kpis(filters)["avg_session_seconds"] == 0
+        assert analytics.session_length_distribution(filters)["sessions"].sum() == 0
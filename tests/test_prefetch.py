@@ -0,0 +1,62 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import analytics
+from analytics import Filters, Prefetcher
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = []
+
+    def submit(self, fn, selection):
+        future = super().submit(fn, selection)
+        self.submitted.append((fn, selection, future))
+        return future
+
+
+def wait(prefetcher, timeout=30):
+    deadline = time.monotonic() + timeout
+    while prefetcher.pending():
+        if time.monotonic() > deadline:
+            pytest.fail(f"prefetch still pending after {timeout}s")
+        time.sleep(0.01)
+
+
+def test_warm_skips_rendered_tab_then_prefetches_neighbours(tables):
+    executor = RecordingExecutor()
+    prefetcher = Prefetcher(executor)
+    current = Filters(year=2014, month=2)
+
+    prefetcher.warm(current, analytics.filter_options(), skip_tab="website")
+    wait(prefetcher)
+
+    current_futures = [future for _, selection, future in executor.submitted if selection == current]
+    current_queries = {fn for fn, selection, _ in executor.submitted if selection == current}
+    neighbours = {selection for _, selection, _ in executor.submitted if selection != current}
+
+    assert not current_queries & set(analytics.TAB_QUERIES["website"])
+    assert current_queries == {q for tab, qs in analytics.TAB_QUERIES.items() if tab != "website" for q in qs}
+    assert neighbours == {Filters(year=2014, month=1), Filters(year=2014, month=3)}
+
+    # Neighbours are only queued once the current selection has finished
+    first_neighbour = next(i for i, (_, selection, _) in enumerate(executor.submitted) if selection != current)
+    assert len(current_futures) == first_neighbour
+    executor.shutdown()
+
+
+def test_new_selection_does_not_queue_old_neighbours(tables):
+    executor = RecordingExecutor()
+    prefetcher = Prefetcher(executor)
+    options = analytics.filter_options()
+
+    prefetcher.warm(Filters(year=2014, month=2), options)
+    prefetcher.warm(Filters(year=2014, month=3, device="mobile"), options)
+    wait(prefetcher)
+
+    queued = {selection for _, selection, future in executor.submitted if not future.cancelled()}
+    assert Filters(year=2014, month=1) not in queued
+    executor.shutdown()
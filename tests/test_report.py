@@ -0,0 +1,41 @@
+import json
+import sys
+
+import pytest
+
+from analytics import Filters
+from analytics import report
+
+
+def test_render_reports_writes_each_selection(tables, tmp_path):
+    selections = [Filters(year=2014, month=1), Filters(year=2014, month=2, device="mobile")]
+    seen = []
+
+    folders = report.render_reports(
+        selections, tmp_path, workers=2, progress=lambda done, total, folder: seen.append((done, total))
+    )
+
+    assert sorted(seen) == [(1, 2), (2, 2)]
+    assert (tmp_path / "index.html").exists()
+    for folder in folders:
+        kpis = json.loads((folder / "kpis.json").read_text())
+        assert kpis["total_orders"] > 0
+        assert (folder / "funnel.csv").exists()
+
+
+def test_reports_share_one_plotly_js(tables, tmp_path):
+    (folder,) = report.render_reports([Filters(year=2014, month=1)], tmp_path)
+
+    page = (folder / "index.html").read_text(encoding="utf-8")
+    assert (tmp_path / report.PLOTLY_JS).exists()
+    assert page.count("<script src=") == 1
+    assert "cdn.plot.ly" not in page
+
+
+def test_png_without_kaleido_is_a_usage_error(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, "kaleido", None)
+
+    with pytest.raises(SystemExit):
+        report.main(["--png"])
+
+    assert "kaleido" in capsys.readouterr().err
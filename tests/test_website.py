@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+import analytics
+from analytics import Filters
+from analytics.website import STAGE_BY_URL
+
+SELECTIONS = [
+    Filters(),
+    Filters(year=2014, month=2),
+    Filters(year=2014, month=3, campaign="brand", device="mobile"),
+    Filters(year=2013),
+]
+
+
+def baseline_orders(tables, filters):
+    """The original app's order filter: year and month only."""
+    orders = tables.orders
+    if filters.year != "All":
+        orders = orders[orders["year"] == filters.year]
+    if filters.month != "All":
+        orders = orders[orders["month"] == filters.month]
+    return orders
+
+
+def plain(frame):
+    """Categorical columns as their values, for comparing against string-based formulas."""
+    return frame.apply(lambda column: column.astype(object) if column.dtype == "category" else column)
+
+
+@pytest.mark.parametrize("filters", SELECTIONS)
+def test_website_kpis_match_baseline(tables, filters):
+    sessions, pageviews = tables.website_sessions, tables.pageviews
+    orders = baseline_orders(tables, filters)
+
+    total_sessions = sessions["website_session_id"].nunique()
+    converted = sessions["website_session_id"].isin(orders["website_session_id"]).sum()
+    per_session = pageviews.groupby("website_session_id")["pageview_url"].count()
+
+    assert analytics.website_kpis(filters) == pytest.approx({
+        "total_sessions": total_sessions,
+        "total_pageviews": pageviews.shape[0],
+        "overall_bounce_rate": (per_session == 1).sum() / total_sessions,
+        "overall_conversion_rate": converted / total_sessions,
+    })
+
+
+def test_bounce_by_month_matches_baseline(tables):
+    per_session = (
+        tables.pageviews.groupby("website_session_id")["pageview_url"]
+        .count()
+        .reset_index(name="pageviews_count")
+    )
+    sessions = tables.website_sessions.merge(per_session, on="website_session_id", how="left")
+    sessions["pageviews_count"] = sessions["pageviews_count"].fillna(0)
+    sessions["month"] = sessions["created_at"].dt.to_period("M").dt.to_timestamp()
+    expected = (
+        sessions.groupby("month")
+        .apply(lambda x: (x["pageviews_count"] == 1).mean())
+        .reset_index(name="bounce_rate")
+    )
+
+    pd.testing.assert_frame_equal(analytics.bounce_by_month(Filters()), expected)
+
+
+@pytest.mark.parametrize("filters", SELECTIONS)
+def test_funnel_matches_baseline(tables, filters):
+    pageviews = tables.pageviews.assign(
+        funnel_stage=tables.pageviews["pageview_url"].astype(object).apply(STAGE_BY_URL.get)
+    )
+    pageviews = pageviews[pageviews["funnel_stage"].notna()]
+    converted_ids = baseline_orders(tables, filters)["website_session_id"]
+
+    expected = pageviews.groupby("funnel_stage").agg(
+        sessions=("website_session_id", "nunique"),
+        conversions=("website_session_id", lambda ids: ids[ids.isin(converted_ids)].nunique()),
+    )
+    expected["conversion_rate"] = expected["conversions"] / expected["sessions"]
+
+    funnel = plain(analytics.funnel(filters)).set_index("funnel_stage")
+    pd.testing.assert_frame_equal(
+        funnel, expected.reindex(funnel.index), check_dtype=False, check_names=False
+    )
+
+
+@pytest.mark.parametrize("filters", SELECTIONS)
+def test_revenue_by_campaign_matches_baseline(tables, filters):
+    lines = tables.order_items.merge(
+        baseline_orders(tables, filters)[["order_id", "website_session_id"]], on="order_id"
+    )
+    lines = lines.merge(
+        plain(tables.website_sessions[["website_session_id", "utm_campaign"]]),
+        on="website_session_id", how="left",
+    )
+    expected = lines.groupby("utm_campaign")["price_usd"].sum()
+
+    revenue = plain(analytics.revenue_by_campaign(filters)).set_index("utm_campaign")["price_usd"]
+    assert revenue.is_monotonic_decreasing
+    pd.testing.assert_series_equal(revenue, expected.reindex(revenue.index), check_names=False)